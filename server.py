@@ -14,14 +14,29 @@ Usage Flow:
 """
 
 import asyncio
+import atexit
+import fnmatch
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
+import logging.handlers
+import mmap
 import os
+import posixpath
+import queue
 import re
-import shutil
+import stat
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple
 
 from fastmcp import FastMCP
 from dotenv import load_dotenv
@@ -34,17 +49,211 @@ from src.pr_creator import PRCreator
 # Load environment variables
 load_dotenv('config.env')
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('pr_splitter.log'),
-        logging.StreamHandler()
-    ]
-)
+# Setup logging: tool handlers only enqueue records, a background
+# listener thread does the file and stream writes
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('pr_splitter.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
+# Flush queued records on any interpreter exit, including when the server is
+# started through another entry point than main()
+atexit.register(log_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge args into the message here; the listener's handlers add the full format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# File categorization for PR file lists. Alternatives are tried in order
+# (root files, then configs, then docs) and the matching group names the category.
+CATEGORY_RE = re.compile(
+    r'^(?:'
+    r'(?P<other>(?:.*/)?(?:\.gitignore|requirements\.txt|setup\.py|pyproject\.toml)$)'
+    r'|(?P<configs>.*\.(?:ya?ml|json|toml|ini|env|cfg)$|(?:.*/)?(?i:config)(?:/|[^/]*$))'
+    r'|(?P<docs>.*\.(?:md|rst|txt)$|(?:.*/)?[^/]*(?:README|LICENSE|CHANGELOG)[^/]*$)'
+    r')',
+    re.DOTALL
+)
+
+# Seconds to reuse the installed-package check in check_auth_status
+DEPENDENCY_CACHE_TTL = 60
+
+# Closing sections appended to every generated PR description
+PR_DESCRIPTION_FOOTER = """### Review Focus
+- Code correctness
+- Integration points with other parts
+
+---
+*Generated by PR-Splitter-MCP*"""
+
+# Bytes scanned per step when counting lines
+LINE_COUNT_CHUNK = 1 << 20
+
+# Files up to this size are counted through a reused per-thread buffer
+LINE_COUNT_BUFFER_SIZE = 256 * 1024
+
+# Directories (and stray files of the same name) never included in folder splits
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    '__pycache__', '.git', '.venv', 'venv', 'node_modules',
+    '.pytest_cache', '.mypy_cache'
+})
+
+# File names never included in folder splits
+DEFAULT_EXCLUDE_FILES_RE = re.compile('|'.join(
+    fnmatch.translate(p) for p in ('*.pyc', '*.pyo', '.DS_Store')
+))
+
+# Average bytes per source line, used to estimate line counts from file sizes
+ESTIMATED_BYTES_PER_LINE = 40
+
+# Threads used to count lines of local folder files
+LINE_COUNT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of distinct include/exclude pattern sets whose compiled regex is kept
+GLOB_CACHE_SIZE = 256
+
+# Number of distinct PR file lists whose categorization is kept in memory
+CATEGORIZE_CACHE_SIZE = 32
+
+# Number of scanned folders whose file list and line counts are kept in memory
+FOLDER_CACHE_SIZE = 32
+
+
+@dataclass(slots=True)
+class PREntry:
+    """A single PR of a split plan, as built by the split helpers."""
+    index: int
+    name: str
+    branch_name: str
+    title: str
+    files: List[str]
+    description: str
+    depends_on: List[int]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "name": self.name,
+            "branch_name": self.branch_name,
+            "title": self.title,
+            "files": self.files,
+            "description": self.description,
+            "depends_on": self.depends_on
+        }
+
+
+def _walk_files(
+    path: str,
+    prune: Tuple[str, ...] = (),
+    skip_names: frozenset = frozenset(),
+    skip_file_re: Optional[re.Pattern] = None,
+    keep: Optional[Callable[[str], bool]] = None
+) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Yield (file path, path relative to path, stat) for regular files under path
+    in a single os.walk pass.
+    
+    Directories whose name contains any of the prune substrings are not descended
+    into, and symlinked directories are never followed. Directories and files named
+    exactly like an entry of skip_names are skipped, as are files whose name
+    matches skip_file_re or whose relative path keep rejects. Only files that
+    pass every filter are stat'ed.
+    """
+    prefix_len = len(os.path.join(path, ''))
+    
+    def on_error(err: OSError) -> None:
+        logger.warning("Cannot read directory: %s", err.filename)
+    
+    for dirpath, dirnames, filenames in os.walk(path, onerror=on_error, followlinks=False):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in skip_names and not any(s in d for s in prune)
+        ]
+        for name in filenames:
+            if name in skip_names or (skip_file_re and skip_file_re.match(name)):
+                continue
+            full_path = os.path.join(dirpath, name)
+            rel_path = full_path[prefix_len:]
+            if keep is not None and not keep(rel_path):
+                continue
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                # Broken symlink or file removed during the walk
+                continue
+            if stat.S_ISREG(st.st_mode):
+                yield full_path, rel_path, st
+
+
+def _is_glob(pattern: str) -> bool:
+    """Check if a pattern contains glob wildcards."""
+    return any(c in pattern for c in '*?[')
+
+
+@functools.lru_cache(maxsize=GLOB_CACHE_SIZE)
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile glob patterns into one regex matching a trailing run of path
+    components. Unlike PurePath.match, wildcards follow fnmatch and may
+    span separators: "*" and "?" also match "/", so "docs/*.md" matches
+    "docs/a/b.md" as well as "docs/a.md".
+    
+    Results are memoized, so repeated calls with the same patterns
+    reuse the compiled regex.
+    """
+    if not patterns:
+        return None
+    alternatives = '|'.join(fnmatch.translate(p) for p in patterns)
+    return re.compile(rf'(?:^|[/\\])(?:{alternatives})')
+
+
+# Per-thread read buffer reused by _count_lines for small files
+_line_count_local = threading.local()
+
+
+def _count_lines(path: str) -> int:
+    """Count lines in a file without decoding it (same result as str.splitlines for \n endings)."""
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        if size <= LINE_COUNT_BUFFER_SIZE:
+            # Small files: read into a reused buffer rather than mapping them
+            buf = getattr(_line_count_local, 'buf', None)
+            if buf is None:
+                buf = _line_count_local.buf = bytearray(LINE_COUNT_BUFFER_SIZE)
+            view = memoryview(buf)
+            lines = 0
+            last = b'\n'
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                lines += buf.count(b'\n', 0, n)
+                last = buf[n - 1:n]
+            return lines + (0 if last == b'\n' else 1)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # mmap.count() only exists on Python 3.13+, so count bounded slices
+            lines = sum(
+                mm[i:i + LINE_COUNT_CHUNK].count(b'\n')
+                for i in range(0, size, LINE_COUNT_CHUNK)
+            )
+            return lines + (0 if mm[-1:] == b'\n' else 1)
+
+
+def _count_lines_or_zero(path: str) -> int:
+    """Count lines in a file, treating unreadable files as empty."""
+    try:
+        return _count_lines(path)
+    except OSError:
+        return 0
+
 
 class PRSplitterMCPServer:
     """
@@ -59,11 +268,31 @@ class PRSplitterMCPServer:
         
         # Initialize components
         self.analyzer = CodeAnalyzer()
-        self.planner = SplitPlanner()
+        # The planner shares the analyzer, so a plan reuses a prior analysis
+        self.planner = SplitPlanner(self.analyzer)
         self.git_manager = GitManager()
         self.pr_creator = PRCreator()
         
-        # Server statistics
+        # Path-hash -> per-file (category, module) assignments; folder plans
+        # categorize in worker threads
+        self._categorize_cache: OrderedDict = OrderedDict()
+        self._categorize_lock = threading.Lock()
+        
+        # (folder, file fingerprint) -> (per-file line counts, total lines);
+        # folders are scanned in worker threads
+        self._folder_cache: OrderedDict = OrderedDict()
+        self._folder_lock = threading.Lock()
+        
+        # Server statistics (uptime is measured on the monotonic clock)
+        self._start_monotonic = time.monotonic()
+        self._stats_lock = threading.Lock()
+        
+        # (monotonic timestamp, result) of the last check_dependencies() call
+        self._deps_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._deps_lock = asyncio.Lock()
+        
+        # Serializes tool calls that check out branches in the git manager's repo
+        self._git_lock = asyncio.Lock()
         self.stats = {
             "start_time": datetime.now(),
             "analyses_performed": 0,
@@ -77,78 +306,101 @@ class PRSplitterMCPServer:
         
         logger.info("PR-Splitter MCP Server initialized")
     
-    def _categorize_files(self, files: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
-        """Categorize files by module/directory and type."""
+    def _increment_stat(self, name: str, amount: int = 1):
+        """Increment a server statistic; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[name] += amount
+    
+    async def _get_dependencies_status(self) -> Dict[str, Any]:
+        """Return check_dependencies() output, cached for DEPENDENCY_CACHE_TTL seconds."""
+        async with self._deps_lock:
+            if self._deps_cache and time.monotonic() - self._deps_cache[0] < DEPENDENCY_CACHE_TTL:
+                return self._deps_cache[1]
+            deps_status = await asyncio.to_thread(self.pr_creator.check_dependencies)
+            self._deps_cache = (time.monotonic(), deps_status)
+            return deps_status
+    
+    def _categorize_files(self, paths: List[str]) -> Dict[str, Any]:
+        """Categorize file paths by module/directory and type."""
         categorized = {
             "configs": [],
             "docs": [],
-            "modules": {},  # module_name -> files
+            "modules": defaultdict(list),  # module_name -> files
             "other": []
         }
         
-        config_patterns = ['.yaml', '.yml', '.json', '.toml', '.ini', '.env', '.cfg']
-        doc_patterns = ['.md', '.rst', '.txt', 'README', 'LICENSE', 'CHANGELOG']
-        root_files = ['.gitignore', 'requirements.txt', 'setup.py', 'pyproject.toml']
+        # Categorization depends only on the paths, so reuse it for repeated
+        # calls on the same PR (e.g. when only strategy or PR count changes)
+        key = hashlib.blake2b(
+            b'\x00'.join(p.encode() for p in paths), digest_size=16
+        ).digest()
+        with self._categorize_lock:
+            assignments = self._categorize_cache.get(key)
+            if assignments is not None:
+                self._categorize_cache.move_to_end(key)
+        if assignments is None:
+            assignments = self._classify_paths(paths)
+            with self._categorize_lock:
+                self._categorize_cache[key] = assignments
+                if len(self._categorize_cache) > CATEGORIZE_CACHE_SIZE:
+                    self._categorize_cache.popitem(last=False)
         
-        # First pass: find common prefix to strip
-        paths = [f.get("path", "") for f in files]
-        if paths:
-            # Find common directory prefix
-            common_parts = paths[0].split('/')
-            for p in paths[1:]:
-                parts = p.split('/')
-                new_common = []
-                for i, (a, b) in enumerate(zip(common_parts, parts)):
-                    if a == b:
-                        new_common.append(a)
-                    else:
-                        break
-                common_parts = new_common
-            common_prefix = '/'.join(common_parts)
-            if common_prefix:
-                common_prefix += '/'
-        else:
+        for path, (category, module) in zip(paths, assignments):
+            if category == "modules":
+                categorized["modules"][module].append(path)
+            else:
+                categorized[category].append(path)
+        
+        categorized["modules"] = dict(categorized["modules"])
+        return categorized
+    
+    @staticmethod
+    def _classify_paths(paths: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """Classify each path as (category, module); module is set only for "modules"."""
+        assignments = []
+        
+        # First pass: find common directory prefix to strip
+        # (PR paths are forward-slash separated, so use posixpath on every platform)
+        if not paths:
             common_prefix = ''
+        elif len(paths) == 1:
+            # A single file's common directory is simply its parent
+            common_prefix = paths[0].rpartition('/')[0]
+        else:
+            try:
+                common_prefix = posixpath.commonpath(paths)
+            except ValueError:
+                # Mix of absolute and relative paths
+                common_prefix = ''
+        if common_prefix and not common_prefix.endswith('/'):
+            common_prefix += '/'
+        prefix_len = len(common_prefix)
         
-        for f in files:
-            path = f.get("path", "")
-            basename = os.path.basename(path)
-            
-            # Strip common prefix to get relative path
-            rel_path = path[len(common_prefix):] if path.startswith(common_prefix) else path
-            
-            # Check if root/config file (non-code files)
-            if basename in root_files:
-                categorized["other"].append(f)
-            # Check if config file
-            elif any(path.endswith(p) for p in config_patterns) or 'config' in path.lower():
-                categorized["configs"].append(f)
-            # Check if doc file
-            elif any(p in basename for p in doc_patterns):
-                categorized["docs"].append(f)
+        for path in paths:
+            # Root files, configs (by extension, config/ directory or config*
+            # name) and docs are resolved by a single regex match
+            match = CATEGORY_RE.match(path)
+            if match:
+                assignments.append((match.lastgroup, None))
             # Check module based on RELATIVE path
             else:
+                # Strip common prefix to get relative path
+                rel_path = path[prefix_len:] if path.startswith(common_prefix) else path
                 parts = rel_path.split('/')
                 if len(parts) > 1:
                     # Use first directory in relative path as module
-                    module = parts[0]
-                    
-                    if module not in categorized["modules"]:
-                        categorized["modules"][module] = []
-                    categorized["modules"][module].append(f)
+                    assignments.append(("modules", parts[0]))
                 else:
                     # Root-level code files go to "core" module
                     if path.endswith('.py') or path.endswith('.js') or path.endswith('.ts'):
-                        if "core" not in categorized["modules"]:
-                            categorized["modules"]["core"] = []
-                        categorized["modules"]["core"].append(f)
+                        assignments.append(("modules", "core"))
                     else:
-                        categorized["other"].append(f)
+                        assignments.append(("other", None))
         
-        return categorized
+        return assignments
     
     def _split_pr_by_module(self, categorized: Dict, target_count: int, 
-                            branch_prefix: str, title_prefix: str) -> List[Dict]:
+                            branch_prefix: str, title_prefix: str) -> List[PREntry]:
         """Split files by module/directory."""
         prs = []
         pr_index = 1
@@ -156,15 +408,15 @@ class PRSplitterMCPServer:
         # PR1: Configs and docs (setup)
         setup_files = categorized["configs"] + categorized["docs"] + categorized["other"]
         if setup_files:
-            prs.append({
-                "index": pr_index,
-                "name": "configs",
-                "branch_name": f"{branch_prefix}-configs",
-                "title": f"{title_prefix}: Configuration and documentation",
-                "files": [f["path"] for f in setup_files],
-                "description": "Project setup: configs, docs, and root files",
-                "depends_on": []
-            })
+            prs.append(PREntry(
+                index=pr_index,
+                name="configs",
+                branch_name=f"{branch_prefix}-configs",
+                title=f"{title_prefix}: Configuration and documentation",
+                files=setup_files,
+                description="Project setup: configs, docs, and root files",
+                depends_on=[]
+            ))
             pr_index += 1
         
         # Remaining PRs: By module
@@ -175,142 +427,313 @@ class PRSplitterMCPServer:
         
         # If too many modules, combine some
         if len(modules) > remaining_slots:
-            # Sort by file count, combine smallest
-            modules.sort(key=lambda x: len(x[1]))
-            while len(modules) > remaining_slots:
-                small1 = modules.pop(0)
-                small2 = modules.pop(0) if modules else (None, [])
-                combined_name = f"{small1[0]}_{small2[0]}" if small2[0] else small1[0]
-                combined_files = small1[1] + (small2[1] if small2[1] else [])
-                modules.append((combined_name, combined_files))
-                modules.sort(key=lambda x: len(x[1]))
+            # Min-heap by file count, combine the two smallest each step
+            # (sequence number breaks ties so file lists are never compared)
+            heap = [(len(files), name, seq, files) for seq, (name, files) in enumerate(modules)]
+            heapq.heapify(heap)
+            seq = len(heap)
+            while len(heap) > max(1, remaining_slots):
+                c1, n1, _, f1 = heapq.heappop(heap)
+                c2, n2, _, f2 = heapq.heappop(heap)
+                heapq.heappush(heap, (c1 + c2, f"{n1}_{n2}", seq, f1 + f2))
+                seq += 1
+            modules = [(name, files) for _, name, _, files in sorted(heap)]
         
         for module_name, module_files in modules:
-            prs.append({
-                "index": pr_index,
-                "name": module_name,
-                "branch_name": f"{branch_prefix}-{module_name.replace('/', '-')}",
-                "title": f"{title_prefix}: {module_name} module",
-                "files": [f["path"] for f in module_files],
-                "description": f"Implementation of {module_name} module",
-                "depends_on": [1] if pr_index > 1 else []
-            })
+            prs.append(PREntry(
+                index=pr_index,
+                name=module_name,
+                branch_name=f"{branch_prefix}-{module_name.replace('/', '-')}",
+                title=f"{title_prefix}: {module_name} module",
+                files=module_files,
+                description=f"Implementation of {module_name} module",
+                depends_on=[1] if pr_index > 1 else []
+            ))
             pr_index += 1
         
         return prs
     
     def _split_pr_by_type(self, categorized: Dict, target_count: int,
-                          branch_prefix: str, title_prefix: str) -> List[Dict]:
+                          branch_prefix: str, title_prefix: str) -> List[PREntry]:
         """Split files by type (configs -> code -> docs)."""
         prs = []
         pr_index = 1
         
         # PR1: Configs
         if categorized["configs"]:
-            prs.append({
-                "index": pr_index,
-                "name": "configs",
-                "branch_name": f"{branch_prefix}-configs",
-                "title": f"{title_prefix}: Configuration files",
-                "files": [f["path"] for f in categorized["configs"]],
-                "description": "Configuration and setup files",
-                "depends_on": []
-            })
+            prs.append(PREntry(
+                index=pr_index,
+                name="configs",
+                branch_name=f"{branch_prefix}-configs",
+                title=f"{title_prefix}: Configuration files",
+                files=categorized["configs"],
+                description="Configuration and setup files",
+                depends_on=[]
+            ))
             pr_index += 1
         
-        # Middle PRs: Code modules
-        all_code_files = []
-        for module_files in categorized["modules"].values():
-            all_code_files.extend(module_files)
-        all_code_files.extend(categorized["other"])
+        # Middle PRs: Code modules (streamed, one list allocated per batch)
+        code_files = itertools.chain(
+            itertools.chain.from_iterable(categorized["modules"].values()),
+            categorized["other"]
+        )
+        total_code = sum(len(v) for v in categorized["modules"].values()) + len(categorized["other"])
         
-        if all_code_files:
+        if total_code:
             # Split code files into batches
             code_pr_count = max(1, target_count - 2)  # Reserve for configs and docs
-            batch_size = max(1, len(all_code_files) // code_pr_count)
+            batch_size = max(1, total_code // code_pr_count)
             
-            for i in range(0, len(all_code_files), batch_size):
-                batch = all_code_files[i:i+batch_size]
+            for _ in range(0, total_code, batch_size):
+                batch = list(itertools.islice(code_files, batch_size))
                 if batch:
-                    prs.append({
-                        "index": pr_index,
-                        "name": f"code-{pr_index}",
-                        "branch_name": f"{branch_prefix}-code-{pr_index}",
-                        "title": f"{title_prefix}: Code batch {pr_index - 1}",
-                        "files": [f["path"] for f in batch],
-                        "description": f"Code implementation batch {pr_index - 1}",
-                        "depends_on": [1] if pr_index > 1 else []
-                    })
+                    prs.append(PREntry(
+                        index=pr_index,
+                        name=f"code-{pr_index}",
+                        branch_name=f"{branch_prefix}-code-{pr_index}",
+                        title=f"{title_prefix}: Code batch {pr_index - 1}",
+                        files=batch,
+                        description=f"Code implementation batch {pr_index - 1}",
+                        depends_on=[1] if pr_index > 1 else []
+                    ))
                     pr_index += 1
         
         # Last PR: Docs
         if categorized["docs"]:
-            prs.append({
-                "index": pr_index,
-                "name": "docs",
-                "branch_name": f"{branch_prefix}-docs",
-                "title": f"{title_prefix}: Documentation",
-                "files": [f["path"] for f in categorized["docs"]],
-                "description": "Documentation files",
-                "depends_on": list(range(1, pr_index))
-            })
+            prs.append(PREntry(
+                index=pr_index,
+                name="docs",
+                branch_name=f"{branch_prefix}-docs",
+                title=f"{title_prefix}: Documentation",
+                files=categorized["docs"],
+                description="Documentation files",
+                depends_on=list(range(1, pr_index))
+            ))
         
         return prs
     
-    def _split_pr_balanced(self, files: List[Dict], target_count: int,
-                           branch_prefix: str, title_prefix: str) -> List[Dict]:
+    def _split_pr_balanced(self, paths: List[str], line_counts: List[int], target_count: int,
+                           branch_prefix: str, title_prefix: str) -> List[PREntry]:
         """Split files balancing lines of code."""
-        # Sort files by lines (descending)
-        sorted_files = sorted(files, key=lambda x: x.get("lines", 0), reverse=True)
+        # Order file indices by lines (descending)
+        order = sorted(range(len(paths)), key=line_counts.__getitem__, reverse=True)
         
-        # Use greedy bin packing
-        prs = [{"files": [], "lines": 0} for _ in range(target_count)]
+        # Use greedy bin packing (LPT): min-heap of (lines, bin index, paths)
+        heap = [(0, i, []) for i in range(target_count)]
+        heapq.heapify(heap)
         
-        for f in sorted_files:
-            # Find bin with minimum lines
-            min_bin = min(prs, key=lambda x: x["lines"])
-            min_bin["files"].append(f)
-            min_bin["lines"] += f.get("lines", 1)
+        for j in order:
+            # Pop the bin with minimum lines
+            lines, idx, bucket = heapq.heappop(heap)
+            bucket.append(paths[j])
+            heapq.heappush(heap, (lines + line_counts[j], idx, bucket))
         
-        # Convert to PR format
+        # Convert to PR format (in bin order; empty bins are always trailing)
         result = []
-        for i, pr in enumerate(prs, 1):
-            if pr["files"]:
-                result.append({
-                    "index": i,
-                    "name": f"batch-{i}",
-                    "branch_name": f"{branch_prefix}-batch-{i}",
-                    "title": f"{title_prefix}: Batch {i} (~{pr['lines']} lines)",
-                    "files": [f["path"] for f in pr["files"]],
-                    "description": f"Balanced batch {i} with approximately {pr['lines']} lines",
-                    "depends_on": [j for j in range(1, i)]
-                })
+        prev_indices: List[int] = []
+        for lines, idx, bucket in sorted(heap, key=lambda x: x[1]):
+            i = idx + 1
+            if bucket:
+                result.append(PREntry(
+                    index=i,
+                    name=f"batch-{i}",
+                    branch_name=f"{branch_prefix}-batch-{i}",
+                    title=f"{title_prefix}: Batch {i} (~{lines} lines)",
+                    files=bucket,
+                    description=f"Balanced batch {i} with approximately {lines} lines",
+                    depends_on=prev_indices.copy()
+                ))
+                prev_indices.append(i)
         
         return result
     
-    def _split_pr_by_file(self, files: List[Dict], target_count: int,
-                          branch_prefix: str, title_prefix: str) -> List[Dict]:
+    def _split_pr_by_file(self, paths: List[str], target_count: int,
+                          branch_prefix: str, title_prefix: str) -> List[PREntry]:
         """Split files evenly across PRs."""
-        batch_size = max(1, len(files) // target_count)
+        batch_size = max(1, len(paths) // target_count)
         
         prs = []
-        for i in range(0, len(files), batch_size):
-            batch = files[i:i+batch_size]
+        prev_indices: List[int] = []
+        for i in range(0, len(paths), batch_size):
+            batch = paths[i:i+batch_size]
             pr_index = len(prs) + 1
             
             if batch:
-                prs.append({
-                    "index": pr_index,
-                    "name": f"part-{pr_index}",
-                    "branch_name": f"{branch_prefix}-part-{pr_index}",
-                    "title": f"{title_prefix}: Part {pr_index}/{target_count}",
-                    "files": [f["path"] for f in batch],
-                    "description": f"Part {pr_index} of {target_count}",
-                    "depends_on": [j for j in range(1, pr_index)]
-                })
+                prs.append(PREntry(
+                    index=pr_index,
+                    name=f"part-{pr_index}",
+                    branch_name=f"{branch_prefix}-part-{pr_index}",
+                    title=f"{title_prefix}: Part {pr_index}/{target_count}",
+                    files=batch,
+                    description=f"Part {pr_index} of {target_count}",
+                    depends_on=prev_indices.copy()
+                ))
+                prev_indices.append(pr_index)
         
         return prs
 
+    def _split_pr_files(self, paths: List[str], line_counts: List[int], target_count: int,
+                        strategy: str, branch_prefix: str, title_prefix: str) -> List[PREntry]:
+        """
+        Split PR files into PR definitions using the named strategy.
+        
+        Files are passed as parallel lists: paths[i] has line_counts[i] lines.
+        """
+        if strategy == "by_module":
+            return self._split_pr_by_module(self._categorize_files(paths), target_count,
+                                            branch_prefix, title_prefix)
+        elif strategy == "by_type":
+            return self._split_pr_by_type(self._categorize_files(paths), target_count,
+                                          branch_prefix, title_prefix)
+        elif strategy == "balanced":
+            return self._split_pr_balanced(paths, line_counts, target_count,
+                                           branch_prefix, title_prefix)
+        else:  # by_file
+            return self._split_pr_by_file(paths, target_count, branch_prefix, title_prefix)
+
+    def _scan_folder(
+        self,
+        folder_str: str,
+        strategy: str,
+        include_patterns: Optional[List[str]],
+        exclude_patterns: Optional[List[str]]
+    ) -> Tuple[List[str], List[int], int, bool]:
+        """
+        Collect the selected files under a folder with their line counts.
+        
+        Line counts are read only for the balanced strategy (and reused while
+        no selected file changed); other strategies estimate them from sizes.
+        
+        Returns:
+            (relative paths, line counts, total lines, whether lines are estimated)
+        """
+        # Collect all files, fingerprinting their paths, mtimes and sizes
+        rel_paths = []
+        abs_paths = []
+        sizes = []
+        fingerprint = hashlib.blake2b(digest_size=16)
+        
+        # Plain names exclude by substring, glob patterns are compiled into
+        # one regex so each file is checked with a single search
+        exclude_patterns = exclude_patterns or []
+        literal_excludes = [p for p in exclude_patterns if not _is_glob(p)]
+        exclude_re = _compile_globs(tuple(p for p in exclude_patterns if _is_glob(p)))
+        include_re = _compile_globs(tuple(include_patterns)) if include_patterns else None
+        
+        def selected(rel_path: str) -> bool:
+            # Check excludes
+            if any(s in rel_path for s in literal_excludes):
+                return False
+            if exclude_re and exclude_re.search(rel_path):
+                return False
+            
+            # Check includes (if specified)
+            return not include_re or include_re.search(rel_path) is not None
+        
+        # Default excludes are dropped during the walk; every file under a
+        # directory named like a literal exclude would be skipped anyway, so
+        # prune those subtrees instead of walking them. Files are filtered
+        # before they are stat'ed
+        for full_path, rel_path, st in _walk_files(folder_str, tuple(literal_excludes),
+                                                   DEFAULT_EXCLUDE_DIRS, DEFAULT_EXCLUDE_FILES_RE,
+                                                   selected):
+            rel_paths.append(rel_path)
+            abs_paths.append(full_path)
+            sizes.append(st.st_size)
+            fingerprint.update(f"{rel_path}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+        
+        # Reuse line counts when no selected file was added, removed or modified
+        cache_key = (folder_str, fingerprint.digest())
+        with self._folder_lock:
+            cached = self._folder_cache.get(cache_key)
+            if cached is not None:
+                self._folder_cache.move_to_end(cache_key)
+        lines_estimated = False
+        if cached is not None:
+            # The fingerprint covers the paths, so they match the cached counts
+            line_counts, total_lines = cached
+        elif strategy == "balanced":
+            # Count lines in parallel; file reads release the GIL
+            with ThreadPoolExecutor(max_workers=LINE_COUNT_WORKERS) as executor:
+                line_counts = list(executor.map(_count_lines_or_zero, abs_paths))
+            
+            total_lines = sum(line_counts)
+            with self._folder_lock:
+                self._folder_cache[cache_key] = (line_counts, total_lines)
+                if len(self._folder_cache) > FOLDER_CACHE_SIZE:
+                    self._folder_cache.popitem(last=False)
+        else:
+            # Only the balanced strategy splits by line counts, so the other
+            # strategies skip reading files and estimate lines from sizes
+            line_counts = [size // ESTIMATED_BYTES_PER_LINE for size in sizes]
+            total_lines = sum(line_counts)
+            lines_estimated = True
+        
+        return rel_paths, line_counts, total_lines, lines_estimated
+
+    def _plan_folder(
+        self,
+        folder_path: str,
+        target_pr_count: int,
+        strategy: str,
+        base_branch: str,
+        branch_prefix: str,
+        pr_title_prefix: str,
+        include_patterns: Optional[List[str]],
+        exclude_patterns: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the split_folder_to_plan result; blocking, so tools run it in a worker thread."""
+        logger.info("Generating split plan from folder: %s -> %d PRs", folder_path, target_pr_count)
+        self._increment_stat("plans_generated")
+        
+        folder_str = os.path.abspath(folder_path)
+        if not os.path.isdir(folder_str):
+            return {"status": "error", "message": f"Folder not found: {folder_path}"}
+        
+        rel_paths, line_counts, total_lines, lines_estimated = self._scan_folder(
+            folder_str, strategy, include_patterns, exclude_patterns
+        )
+        
+        if not rel_paths:
+            return {"status": "error", "message": "No files found in folder"}
+        
+        # Generate plan based on strategy
+        prs = [
+            pr.to_dict()
+            for pr in self._split_pr_files(rel_paths, line_counts, target_pr_count, strategy,
+                                           branch_prefix, pr_title_prefix)
+        ]
+        
+        total_files = len(rel_paths)
+        pr_count = len(prs)
+        
+        return {
+            "status": "success",
+            "source_folder": str(folder_path),
+            "plan": {
+                "target_pr_count": target_pr_count,
+                "actual_pr_count": pr_count,
+                "strategy": strategy,
+                "base_branch": base_branch,
+                "branch_prefix": branch_prefix,
+                "prs": prs
+            },
+            "summary": {
+                "total_files": total_files,
+                "total_lines": total_lines,
+                "total_lines_estimated": lines_estimated,
+                "files_per_pr": round(total_files / pr_count, 1) if pr_count else 0,
+                "lines_per_pr": round(total_lines / pr_count, 1) if pr_count else 0
+            },
+            "merge_order": [pr["index"] for pr in prs],
+            "workflow_next_steps": [
+                f"1. Ensure target repo has base branch '{base_branch}'",
+                "2. Use execute_split(plan, source_folder, target_repo, dry_run=False) to create branches",
+                "3. Or use split_and_push_folder() for end-to-end automation",
+                "4. Use create_prs_from_plan() or coding-flow.create_draft_pr() to create PRs"
+            ]
+        }
+
     def _register_tools(self):
         """Register all MCP tools."""
         
@@ -318,7 +741,8 @@ class PRSplitterMCPServer:
         async def analyze_code_structure(
             source_path: str,
             include_patterns: Optional[List[str]] = None,
-            exclude_patterns: Optional[List[str]] = None
+            exclude_patterns: Optional[List[str]] = None,
+            detail_level: str = "full"
         ) -> Dict[str, Any]:
             """
             Analyze the code structure of a directory.
@@ -327,24 +751,100 @@ class PRSplitterMCPServer:
                 source_path: Path to the source directory to analyze
                 include_patterns: Optional list of glob patterns to include (e.g., ["*.py", "*.js"])
                 exclude_patterns: Optional list of glob patterns to exclude
+                detail_level: How much to return - one of:
+                    - "summary": Statistics plus file count and lines per module
+                    - "modules": Everything except the per-file list
+                    - "full": Everything (default)
+                    Use get_module_files() to fetch the files of one module.
                 
             Returns:
                 Analysis result containing:
-                - modules: Detected modules/directories with file counts
+                - modules: Detected modules/directories with file counts and paths
                 - files: List of all files with metadata (path, lines, imports)
                 - dependencies: Dependency graph between files
                 - summary: Statistics about the codebase
             """
-            logger.info(f"Analyzing code structure: {source_path}")
-            self.stats["analyses_performed"] += 1
+            if detail_level not in ("summary", "modules", "full"):
+                return {
+                    "status": "error",
+                    "message": f"Invalid detail_level: {detail_level}. Use 'summary', 'modules' or 'full'"
+                }
             
-            result = self.analyzer.analyze(
+            logger.info("Analyzing code structure: %s", source_path)
+            self._increment_stat("analyses_performed")
+            
+            result = await asyncio.to_thread(
+                self.analyzer.analyze,
                 source_path=source_path,
                 include_patterns=include_patterns,
                 exclude_patterns=exclude_patterns
             )
             
-            return result
+            if result.get("status") != "success" or detail_level == "full":
+                return result
+            
+            # The analysis result is cached, so build a reduced copy
+            if detail_level == "modules":
+                return {k: v for k, v in result.items() if k != "files"}
+            return {
+                "status": result["status"],
+                "source_path": result["source_path"],
+                "summary": result["summary"],
+                "modules": {
+                    name: {"file_count": mod["file_count"], "total_lines": mod["total_lines"]}
+                    for name, mod in result["modules"].items()
+                },
+                "analyzed_at": result["analyzed_at"]
+            }
+        
+        @self.mcp.tool()
+        async def get_module_files(
+            source_path: str,
+            module: str,
+            include_patterns: Optional[List[str]] = None,
+            exclude_patterns: Optional[List[str]] = None
+        ) -> Dict[str, Any]:
+            """
+            Get the files of one module, with metadata.
+            
+            Drill-down companion to analyze_code_structure(detail_level="summary");
+            pass the same source_path and patterns. The analysis is cached, so
+            this does not re-read an unchanged tree.
+            
+            Args:
+                source_path: Path to the analyzed source directory
+                module: Module name, as listed in the analysis "modules"
+                include_patterns: Glob patterns to include, as used for the analysis
+                exclude_patterns: Glob patterns to exclude, as used for the analysis
+                
+            Returns:
+                The module's files with metadata (path, lines, imports)
+            """
+            result = await asyncio.to_thread(
+                self.analyzer.analyze,
+                source_path=source_path,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns
+            )
+            
+            if result.get("status") != "success":
+                return result
+            
+            if module not in result["modules"]:
+                return {
+                    "status": "error",
+                    "message": f"Module not found: {module}",
+                    "available_modules": list(result["modules"])
+                }
+            
+            files = [f for f in result["files"] if f["module"] == module]
+            return {
+                "status": "success",
+                "module": module,
+                "file_count": len(files),
+                "total_lines": result["modules"][module]["total_lines"],
+                "files": files
+            }
         
         @self.mcp.tool()
         async def generate_split_plan(
@@ -374,10 +874,11 @@ class PRSplitterMCPServer:
                 - summary: Statistics about the split
                 - dependency_order: Recommended merge order
             """
-            logger.info(f"Generating split plan: {source_path} -> {target_pr_count} PRs")
-            self.stats["plans_generated"] += 1
+            logger.info("Generating split plan: %s -> %d PRs", source_path, target_pr_count)
+            self._increment_stat("plans_generated")
             
-            result = self.planner.generate_plan(
+            result = await asyncio.to_thread(
+                self.planner.generate_plan,
                 source_path=source_path,
                 target_pr_count=target_pr_count,
                 strategy=strategy,
@@ -409,19 +910,21 @@ class PRSplitterMCPServer:
                 - summary: Success/failure statistics
                 - status: Overall execution status
             """
-            logger.info(f"Executing split: {source_path} -> {target_repo_path} (dry_run={dry_run})")
+            logger.info("Executing split: %s -> %s (dry_run=%s)", source_path, target_repo_path, dry_run)
             
             if not dry_run:
-                self.stats["splits_executed"] += 1
-            
-            self.git_manager.repo_path = Path(target_repo_path).absolute()
+                self._increment_stat("splits_executed")
             
-            result = self.git_manager.execute_split(
-                plan=plan,
-                source_path=source_path,
-                target_repo_path=target_repo_path,
-                dry_run=dry_run
-            )
+            async with self._git_lock:
+                self.git_manager.repo_path = Path(target_repo_path).absolute()
+                
+                result = await asyncio.to_thread(
+                    self.git_manager.execute_split,
+                    plan=plan,
+                    source_path=source_path,
+                    target_repo_path=target_repo_path,
+                    dry_run=dry_run
+                )
             
             return result
         
@@ -504,39 +1007,26 @@ class PRSplitterMCPServer:
                 - summary: Statistics
                 - merge_order: Recommended merge sequence
             """
-            logger.info(f"Generating split plan from PR data: {len(pr_files)} files -> {target_pr_count} PRs")
-            self.stats["plans_generated"] += 1
-            
-            # Convert PR files to internal format
-            files_info = []
-            for f in pr_files:
-                path = f.get("path", f.get("filePath", ""))
-                files_info.append({
-                    "path": path,
-                    "change_type": f.get("changeType", "edit"),
-                    "additions": f.get("additions", 0),
-                    "deletions": f.get("deletions", 0),
-                    "lines": f.get("additions", 0) + f.get("deletions", 0)
-                })
+            logger.info(
+                "Generating split plan from PR data: %d files -> %d PRs",
+                len(pr_files), target_pr_count
+            )
+            self._increment_stat("plans_generated")
             
-            # Categorize files
-            categorized = self._categorize_files(files_info)
+            # Convert PR files to parallel path / line count lists
+            paths = [f.get("path", f.get("filePath", "")) for f in pr_files]
+            line_counts = [f.get("additions", 0) + f.get("deletions", 0) for f in pr_files]
             
             # Generate plan based on strategy
-            prs = []
-            
-            if strategy == "by_module":
-                prs = self._split_pr_by_module(categorized, target_pr_count, branch_prefix, pr_title_prefix)
-            elif strategy == "by_type":
-                prs = self._split_pr_by_type(categorized, target_pr_count, branch_prefix, pr_title_prefix)
-            elif strategy == "balanced":
-                prs = self._split_pr_balanced(files_info, target_pr_count, branch_prefix, pr_title_prefix)
-            else:  # by_file
-                prs = self._split_pr_by_file(files_info, target_pr_count, branch_prefix, pr_title_prefix)
+            prs = [
+                pr.to_dict()
+                for pr in self._split_pr_files(paths, line_counts, target_pr_count, strategy,
+                                               branch_prefix, pr_title_prefix)
+            ]
             
             # Calculate summary
-            total_files = len(files_info)
-            total_lines = sum(f.get("lines", 0) for f in files_info)
+            total_files = len(paths)
+            total_lines = sum(line_counts)
             
             return {
                 "status": "success",
@@ -602,26 +1092,18 @@ class PRSplitterMCPServer:
                 if len(files) > 10:
                     file_list += f"\n- ... and {len(files) - 10} more files"
                 
-                description = f"""## Summary
-{pr.get('description', 'Part of a split PR series.')}
-
-### Files Changed ({len(files)} files)
-{file_list}
-
-"""
+                sections = [
+                    f"## Summary\n{pr.get('description', 'Part of a split PR series.')}",
+                    f"### Files Changed ({len(files)} files)\n{file_list}"
+                ]
                 if include_dependencies and pr.get("depends_on"):
                     deps = pr.get("depends_on", [])
-                    description += f"""### Dependencies
-This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
-
-"""
-                
-                description += f"""### Review Focus
-- Code correctness
-- Integration points with other parts
-
----
-*Generated by PR-Splitter-MCP*"""
+                    sections.append(
+                        "### Dependencies\n"
+                        f"This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}"
+                    )
+                sections.append(PR_DESCRIPTION_FOOTER)
+                description = "\n\n".join(sections)
                 
                 enhanced_prs.append({
                     **pr,
@@ -644,16 +1126,34 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             Returns:
                 Server statistics including uptime and operation counts.
             """
-            uptime = datetime.now() - self.stats["start_time"]
+            uptime_s = time.monotonic() - self._start_monotonic
             return {
-                "uptime_seconds": uptime.total_seconds(),
-                "uptime_formatted": str(uptime),
+                "uptime_seconds": uptime_s,
+                "uptime_formatted": str(timedelta(seconds=uptime_s)),
                 "analyses_performed": self.stats["analyses_performed"],
                 "plans_generated": self.stats["plans_generated"],
                 "splits_executed": self.stats["splits_executed"],
                 "prs_created": self.stats["prs_created"]
             }
         
+        @self.mcp.tool()
+        async def clear_analysis_cache() -> Dict[str, Any]:
+            """
+            Clear memoized code analysis results.
+            
+            Analyses are reused while the analyzed tree is unchanged; use this
+            to force the next analyze_code_structure / generate_split_plan call
+            to re-read every file.
+            
+            Returns:
+                Number of cached analyses that were dropped.
+            """
+            # Takes the analyzer's lock, which a running analysis may hold
+            cleared = await asyncio.to_thread(self.analyzer.clear_cache)
+            self.planner.clear_cache()
+            logger.info("Cleared %d cached analyses", cleared)
+            return {"status": "success", "cleared": cleared}
+        
         @self.mcp.tool()
         async def check_auth_status() -> Dict[str, Any]:
             """
@@ -667,9 +1167,12 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             Returns:
                 Comprehensive status of authentication and dependencies.
             """
-            ado_status = self.pr_creator.check_ado_auth()
-            github_status = self.pr_creator.check_github_auth()
-            deps_status = self.pr_creator.check_dependencies()
+            # Probes are independent, run them concurrently
+            ado_status, github_status, deps_status = await asyncio.gather(
+                asyncio.to_thread(self.pr_creator.check_ado_auth),
+                asyncio.to_thread(self.pr_creator.check_github_auth),
+                self._get_dependencies_status()
+            )
             
             return {
                 "azure_devops": {
@@ -723,9 +1226,10 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             Returns:
                 PR creation result with PR ID and URL.
             """
-            logger.info(f"Creating ADO PR: {source_branch} -> {target_branch}")
+            logger.info("Creating ADO PR: %s -> %s", source_branch, target_branch)
             
-            result = self.pr_creator.create_ado_pr(
+            result = await asyncio.to_thread(
+                self.pr_creator.create_ado_pr,
                 org_url=org_url,
                 project=project,
                 repo=repo,
@@ -738,7 +1242,7 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             )
             
             if result.status == "success":
-                self.stats["prs_created"] += 1
+                self._increment_stat("prs_created")
             
             return result.to_dict()
         
@@ -768,9 +1272,10 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             Returns:
                 PR creation result with PR ID and URL.
             """
-            logger.info(f"Creating GitHub PR: {source_branch} -> {target_branch}")
+            logger.info("Creating GitHub PR: %s -> %s", source_branch, target_branch)
             
-            result = self.pr_creator.create_github_pr(
+            result = await asyncio.to_thread(
+                self.pr_creator.create_github_pr,
                 repo=repo,
                 source_branch=source_branch,
                 target_branch=target_branch,
@@ -780,7 +1285,7 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             )
             
             if result.status == "success":
-                self.stats["prs_created"] += 1
+                self._increment_stat("prs_created")
             
             return result.to_dict()
         
@@ -817,107 +1322,11 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
                 - summary: Statistics
                 - workflow_next_steps: Instructions for next steps
             """
-            logger.info(f"Generating split plan from folder: {folder_path} -> {target_pr_count} PRs")
-            self.stats["plans_generated"] += 1
-            
-            folder = Path(folder_path)
-            if not folder.exists():
-                return {"status": "error", "message": f"Folder not found: {folder_path}"}
-            
-            # Collect all files
-            files_info = []
-            
-            # Default exclude patterns
-            default_excludes = [
-                '__pycache__', '.git', '.venv', 'venv', 'node_modules',
-                '.pytest_cache', '.mypy_cache', '*.pyc', '*.pyo', '.DS_Store'
-            ]
-            all_excludes = (exclude_patterns or []) + default_excludes
-            
-            for file_path in folder.rglob('*'):
-                if file_path.is_file():
-                    # Get relative path
-                    rel_path = str(file_path.relative_to(folder))
-                    
-                    # Check excludes
-                    skip = False
-                    for pattern in all_excludes:
-                        if pattern in rel_path or file_path.match(pattern):
-                            skip = True
-                            break
-                    if skip:
-                        continue
-                    
-                    # Check includes (if specified)
-                    if include_patterns:
-                        include = False
-                        for pattern in include_patterns:
-                            if file_path.match(pattern):
-                                include = True
-                                break
-                        if not include:
-                            continue
-                    
-                    # Count lines
-                    try:
-                        lines = len(file_path.read_text(encoding='utf-8', errors='ignore').splitlines())
-                    except:
-                        lines = 0
-                    
-                    files_info.append({
-                        "path": rel_path,
-                        "change_type": "add",
-                        "lines": lines,
-                        "additions": lines,
-                        "deletions": 0
-                    })
-            
-            if not files_info:
-                return {"status": "error", "message": "No files found in folder"}
-            
-            # Categorize files
-            categorized = self._categorize_files(files_info)
-            
-            # Generate plan based on strategy
-            prs = []
-            
-            if strategy == "by_module":
-                prs = self._split_pr_by_module(categorized, target_pr_count, branch_prefix, pr_title_prefix)
-            elif strategy == "by_type":
-                prs = self._split_pr_by_type(categorized, target_pr_count, branch_prefix, pr_title_prefix)
-            elif strategy == "balanced":
-                prs = self._split_pr_balanced(files_info, target_pr_count, branch_prefix, pr_title_prefix)
-            else:  # by_file
-                prs = self._split_pr_by_file(files_info, target_pr_count, branch_prefix, pr_title_prefix)
-            
-            total_files = len(files_info)
-            total_lines = sum(f.get("lines", 0) for f in files_info)
-            
-            return {
-                "status": "success",
-                "source_folder": str(folder_path),
-                "plan": {
-                    "target_pr_count": target_pr_count,
-                    "actual_pr_count": len(prs),
-                    "strategy": strategy,
-                    "base_branch": base_branch,
-                    "branch_prefix": branch_prefix,
-                    "prs": prs
-                },
-                "summary": {
-                    "total_files": total_files,
-                    "total_lines": total_lines,
-                    "files_per_pr": round(total_files / len(prs), 1) if prs else 0,
-                    "lines_per_pr": round(total_lines / len(prs), 1) if prs else 0
-                },
-                "merge_order": [pr["index"] for pr in prs],
-                "workflow_next_steps": [
-                    f"1. Ensure target repo has base branch '{base_branch}'",
-                    "2. Use execute_split(plan, source_folder, target_repo, dry_run=False) to create branches",
-                    "3. Or use split_and_push_folder() for end-to-end automation",
-                    "4. Use create_prs_from_plan() or coding-flow.create_draft_pr() to create PRs"
-                ]
-            }
+            # Walking, counting and splitting block, so run them off the event loop
+            return await asyncio.to_thread(
+                self._plan_folder, folder_path, target_pr_count, strategy, base_branch,
+                branch_prefix, pr_title_prefix, include_patterns, exclude_patterns
+            )
         
         @self.mcp.tool()
         async def split_and_push_folder(
@@ -960,7 +1369,9 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
                 - branches: Created branches with status
                 - next_steps: How to create the PRs
             """
-            logger.info(f"Split and push: {source_folder} -> {target_repo_path} ({target_pr_count} PRs)")
+            logger.info(
+                "Split and push: %s -> %s (%d PRs)", source_folder, target_repo_path, target_pr_count
+            )
             
             source = Path(source_folder)
             target = Path(target_repo_path)
@@ -972,21 +1383,13 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
                 return {"status": "error", "message": f"Target repo not found: {target_repo_path}"}
             
             # Check if target is a git repo
-            if not self.git_manager.is_git_repo(str(target)):
+            if not await asyncio.to_thread(self.git_manager.is_git_repo, str(target)):
                 return {"status": "error", "message": f"Target is not a git repository: {target_repo_path}"}
             
-            self.git_manager.repo_path = target.absolute()
-            
-            # Step 1: Generate split plan
-            plan_result = await split_folder_to_plan(
-                folder_path=source_folder,
-                target_pr_count=target_pr_count,
-                strategy=strategy,
-                base_branch=base_branch,
-                branch_prefix=branch_prefix,
-                pr_title_prefix=pr_title_prefix,
-                include_patterns=include_patterns,
-                exclude_patterns=exclude_patterns
+            # Step 1: Generate split plan (in a worker thread, like the git work)
+            plan_result = await asyncio.to_thread(
+                self._plan_folder, source_folder, target_pr_count, strategy, base_branch,
+                branch_prefix, pr_title_prefix, include_patterns, exclude_patterns
             )
             
             if plan_result.get("status") != "success":
@@ -994,10 +1397,24 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             
             plan = plan_result["plan"]
             
-            # Adjust file paths if relative_path_in_repo is specified
-            if relative_path_in_repo:
-                for pr in plan["prs"]:
-                    pr["files"] = [os.path.join(relative_path_in_repo, f) for f in pr["files"]]
+            # Normalize each PR once into (branch, commit message, sorted
+            # (target path, source path) pairs), adjusting the plan's file paths
+            # if relative_path_in_repo is specified
+            source_str = os.path.abspath(source_folder)
+            branch_jobs = []
+            for pr in plan["prs"]:
+                source_files = pr["files"]
+                if relative_path_in_repo:
+                    pr["files"] = [os.path.join(relative_path_in_repo, f) for f in source_files]
+                title = pr.get("title", pr.get("description", "Update"))
+                branch_jobs.append((
+                    pr["branch_name"],
+                    f"feat: {title}",
+                    sorted(
+                        (file_path, os.path.join(source_str, src_rel))
+                        for file_path, src_rel in zip(pr["files"], source_files)
+                    )
+                ))
             
             if dry_run:
                 return {
@@ -1015,84 +1432,69 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
                 }
             
             # Step 2: Execute split (create branches, copy files, commit, optionally push)
-            self.stats["splits_executed"] += 1
-            
-            # Ensure base branch exists
-            current_branch = self.git_manager.get_current_branch()
-            checkout_result = self.git_manager.checkout(base_branch)
+            self._increment_stat("splits_executed")
             
-            if checkout_result.get("status") == "error":
-                # Try to create base branch from main/master
-                for fallback in ["main", "master", current_branch]:
+            def create_branches() -> List[Dict[str, Any]]:
+                # Ensure base branch exists
+                checkout_result = self.git_manager.checkout(base_branch)
+                
+                if checkout_result.get("status") == "error" and not self.git_manager.branch_exists(f"refs/heads/{base_branch}"):
+                    # Create base branch from main/master, or the current branch if neither exists
+                    fallback = (
+                        self.git_manager.first_existing_branch(["main", "master"])
+                        or self.git_manager.get_current_branch()
+                    )
                     result = self.git_manager.create_branch(base_branch, fallback)
-                    if result.get("status") == "success":
-                        if push:
-                            self.git_manager.push(base_branch)
-                        break
-            
-            branch_results = []
-            
-            for pr in plan["prs"]:
-                branch_name = pr["branch_name"]
-                files = pr["files"]
-                title = pr.get("title", pr.get("description", "Update"))
+                    if result.get("status") == "success" and push:
+                        self.git_manager.push(base_branch)
                 
-                # Create branch from base
-                branch_result = self.git_manager.create_branch(branch_name, base_branch)
-                if branch_result.get("status") == "error":
-                    branch_results.append({
-                        "branch_name": branch_name,
-                        "status": "error",
-                        "error": branch_result.get("message")
-                    })
-                    continue
+                # Build the branches in parallel worktrees; the main tree stays on base
+                built = self.git_manager.build_branches(base_branch, branch_jobs)
                 
-                # Copy files from source to target
-                copied_files = []
-                for file_path in files:
-                    # Handle relative_path_in_repo
-                    if relative_path_in_repo:
-                        src_rel = file_path.replace(relative_path_in_repo, "").lstrip("/")
+                branch_results = []
+                for (branch_name, _, _), b in zip(branch_jobs, built):
+                    if b["status"] == "success":
+                        branch_results.append({
+                            "branch_name": branch_name,
+                            "status": "success",
+                            "files_copied": b["files_added"],
+                            "commit_hash": b.get("commit_hash"),
+                            "pushed": False
+                        })
+                    elif b["status"] == "warning":
+                        branch_results.append({
+                            "branch_name": branch_name,
+                            "status": "warning",
+                            "files_copied": 0,
+                            "error": b.get("message")
+                        })
                     else:
-                        src_rel = file_path
-                    
-                    src_file = source / src_rel
-                    dst_file = target / file_path
-                    
-                    if src_file.exists():
-                        dst_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(src_file, dst_file)
-                        copied_files.append(file_path)
-                
-                if not copied_files:
-                    branch_results.append({
-                        "branch_name": branch_name,
-                        "status": "warning",
-                        "files_copied": 0,
-                        "error": "No files copied"
-                    })
-                    self.git_manager.checkout(base_branch)
-                    continue
+                        branch_results.append({
+                            "branch_name": branch_name,
+                            "status": "error",
+                            "error": b.get("message")
+                        })
                 
-                # Add, commit
-                self.git_manager.add_files(copied_files)
-                commit_result = self.git_manager.commit(f"feat: {title}")
+                return branch_results
+            
+            # Git work blocks, so run it off the event loop; the lock keeps other
+            # tool calls from switching branches in the repo while this one runs
+            async with self._git_lock:
+                self.git_manager.repo_path = target.absolute()
+                branch_results = await asyncio.to_thread(create_branches)
                 
-                # Push if requested
-                push_result = {"status": "skipped"}
+                # Push every committed branch in one round trip to the remote
                 if push:
-                    push_result = self.git_manager.push(branch_name)
-                
-                branch_results.append({
-                    "branch_name": branch_name,
-                    "status": "success" if push_result.get("status") in ["success", "skipped"] else "partial",
-                    "files_copied": len(copied_files),
-                    "commit_hash": commit_result.get("commit_hash"),
-                    "pushed": push_result.get("status") == "success"
-                })
-                
-                # Return to base branch
-                self.git_manager.checkout(base_branch)
+                    committed = [b for b in branch_results if b["status"] == "success"]
+                    push_results = await asyncio.to_thread(
+                        self.git_manager.push_branches,
+                        [b["branch_name"] for b in committed]
+                    )
+                    for b in committed:
+                        pushed = push_results[b["branch_name"]].get("status") == "success"
+                        b["pushed"] = pushed
+                        if not pushed:
+                            b["status"] = "partial"
             
             return {
                 "status": "success",
@@ -1145,9 +1547,9 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
             Returns:
                 Batch creation results with PR URLs and any errors.
             """
-            logger.info(f"Creating PRs from plan on {platform}")
+            logger.info("Creating PRs from plan on %s", platform)
             
-            result = self.pr_creator.create_prs_from_plan(
+            result = await self.pr_creator.create_prs_from_plan_async(
                 plan=plan,
                 platform=platform,
                 org_url=org_url,
@@ -1156,7 +1558,7 @@ This PR depends on PR(s): {', '.join([f'{d}/{total}' for d in deps])}
                 draft=draft
             )
             
-            self.stats["prs_created"] += result.get("prs_created", 0)
+            self._increment_stat("prs_created", result.get("prs_created", 0))
             
             return result
     
@@ -5,17 +5,122 @@ Analyzes code structure, detects modules, and understands file dependencies.
 
 import os
 import re
+import json
+import time
+import shutil
 import hashlib
-from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+import threading
+import subprocess
+from pathlib import Path, PurePath
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Threads used to read and analyze files; reads release the GIL
+ANALYZE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-@dataclass
+# Number of analysis results kept per analyzer, keyed by tree fingerprint
+ANALYSIS_CACHE_SIZE = 16
+
+# Directory where analysis results are persisted across server restarts
+ANALYSIS_DISK_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "pr-splitter"
+
+# Seconds a persisted analysis result is reused before it is discarded
+ANALYSIS_DISK_CACHE_TTL = 7 * 24 * 3600
+
+# File in the cache directory holding per-file line counts and imports
+FILE_INDEX_NAME = "file-index.json"
+
+# Number of files whose line count and imports are kept for incremental analysis
+FILE_INDEX_SIZE = 100_000
+
+# Read size used when counting lines of files whose content is not parsed
+LINE_COUNT_BUFFER_SIZE = 1 << 16
+
+# Leading bytes of a source file searched for imports; the rest is only line-counted
+IMPORT_SCAN_SIZE = 1 << 16
+
+# grep used to count lines of many files in one process (None where unavailable)
+GREP_PATH = shutil.which("grep") if os.name == "posix" else None
+
+# Paths passed per grep invocation, keeping the command line under ARG_MAX
+LINE_COUNT_BATCH_SIZE = 4096
+
+# Python 'import xxx' / 'from xxx import yyy' statements, matched over a whole file
+PY_IMPORT_RE = re.compile(
+    r'^\s*(?:from[ \t]+(\S+)[ \t]+import|import[ \t]+(\S+))',
+    re.MULTILINE
+)
+
+# JavaScript/TypeScript 'import ... from "pkg"' statements
+JS_IMPORT_FROM_RE = re.compile(r"import\s+.*?\s+from\s+['\"](.+?)['\"]")
+
+# JavaScript/TypeScript 'require("pkg")' calls
+JS_REQUIRE_RE = re.compile(r"require\s*\(\s*['\"](.+?)['\"]")
+
+
+def _read_head_and_count_lines(path: str, head_size: int = 0) -> Tuple[bytes, int]:
+    """
+    Read the first head_size bytes of a file and count all of its lines
+    without decoding (same result as str.splitlines for \n endings).
+    """
+    with open(path, 'rb') as f:
+        head = f.read(head_size)
+        lines = head.count(b'\n')
+        last = head[-1:] or b'\n'
+        while chunk := f.read(LINE_COUNT_BUFFER_SIZE):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    return head, lines + (0 if last == b'\n' else 1)
+
+
+def _count_lines_bytes(path: str) -> int:
+    """Count lines without decoding (same result as str.splitlines for \n endings)."""
+    return _read_head_and_count_lines(path)[1]
+
+
+def _count_lines_batch(paths: List[str]) -> Dict[str, int]:
+    """
+    Count lines of many files with one grep process per batch.
+    
+    `grep -c ''` counts an unterminated last line too, so the counts match
+    _count_lines_bytes (`wc -l` would not). Files grep cannot read, or whose
+    names cannot be parsed back from its output, are missing from the result.
+    """
+    counts = {}
+    if GREP_PATH is None:
+        return counts
+    
+    for start in range(0, len(paths), LINE_COUNT_BATCH_SIZE):
+        try:
+            proc = subprocess.run(
+                [GREP_PATH, '-c', '-a', '-H', '--', '', *paths[start:start + LINE_COUNT_BATCH_SIZE]],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            logger.debug("Batch line count failed: %s", e)
+            return counts
+        
+        # One "path:count" line per file, in argument order
+        for line in proc.stdout.splitlines():
+            path, _, count = line.rpartition(b':')
+            try:
+                counts[os.fsdecode(path)] = int(count)
+            except ValueError:
+                pass
+    
+    return counts
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a single file."""
     path: str
@@ -40,7 +145,7 @@ class FileInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """Information about a module/directory."""
     name: str
@@ -54,7 +159,8 @@ class ModuleInfo:
             "name": self.name,
             "path": self.path,
             "file_count": len(self.files),
-            "files": [f.to_dict() for f in self.files],
+            # Full file details are listed once, in the analysis "files" array
+            "files": [f.path for f in self.files],
             "submodules": self.submodules,
             "total_lines": self.total_lines
         }
@@ -86,27 +192,85 @@ class CodeAnalyzer:
     }
     
     # Config file extensions
-    CONFIG_EXTENSIONS = {
+    CONFIG_EXTENSIONS = frozenset({
         '.yaml', '.yml', '.json', '.toml', '.ini', '.cfg', '.conf',
         '.xml', '.properties', '.env'
-    }
+    })
     
     # Documentation extensions
-    DOC_EXTENSIONS = {
+    DOC_EXTENSIONS = frozenset({
         '.md', '.rst', '.txt', '.adoc'
+    })
+    
+    # Every extension the analyzer processes
+    ALL_EXTENSIONS = frozenset({*CODE_EXTENSIONS, *CONFIG_EXTENSIONS, *DOC_EXTENSIONS})
+    
+    # Type category of each extension (code wins over config and docs)
+    EXTENSION_CATEGORIES = {
+        **dict.fromkeys(DOC_EXTENSIONS, "docs"),
+        **dict.fromkeys(CONFIG_EXTENSIONS, "config"),
+        **dict.fromkeys(CODE_EXTENSIONS, "code"),
     }
     
-    # Patterns to ignore
-    IGNORE_PATTERNS = {
+    # Extensions whose imports are extracted with the JavaScript patterns
+    JS_EXTENSIONS = frozenset({'.js', '.ts', '.jsx', '.tsx'})
+    
+    # Directory and file names to ignore
+    IGNORE_NAMES = frozenset({
         '__pycache__', '.git', '.svn', 'node_modules', 'venv', '.venv',
-        'env', '.env', 'dist', 'build', '.idea', '.vscode', '*.egg-info',
+        'env', '.env', 'dist', 'build', '.idea', '.vscode',
         '.pytest_cache', '.mypy_cache', '__snapshots__'
-    }
+    })
     
-    def __init__(self):
+    # Name suffixes to ignore (e.g. "mypkg.egg-info")
+    IGNORE_SUFFIXES = ('.egg-info',)
+    
+    def __init__(self, cache_dir: Optional[Path] = ANALYSIS_DISK_CACHE_DIR):
+        """
+        Args:
+            cache_dir: Directory to persist analysis results in, so they
+                survive restarts (None keeps them in memory only)
+        """
         self.files: List[FileInfo] = []
         self.modules: Dict[str, ModuleInfo] = {}
-        self.dependencies: Dict[str, Set[str]] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+        
+        # (source, patterns, tree fingerprint) -> (result, files, modules, dependencies)
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        
+        # Absolute path -> [mtime_ns, size, lines, imports], loaded on first use
+        self._file_index: Optional[OrderedDict] = None
+    
+    def clear_cache(self) -> int:
+        """
+        Drop all memoized analysis results, in memory and on disk.
+        
+        Returns:
+            Number of cached analyses dropped (the persisted ones, or the
+            in-memory ones when there is no cache_dir)
+        """
+        # Waits for a running analysis, so it cannot write back what is cleared
+        with self._lock:
+            count = len(self._analysis_cache)
+            self._analysis_cache.clear()
+            self._file_index = OrderedDict()
+            if self.cache_dir is None:
+                return count
+            
+            try:
+                (self.cache_dir / FILE_INDEX_NAME).unlink()
+            except OSError:
+                pass
+            count = 0
+            for path in self._disk_cache_entries():
+                try:
+                    path.unlink()
+                    count += 1
+                except OSError:
+                    pass
+            return count
     
     def analyze(
         self,
@@ -124,7 +288,23 @@ class CodeAnalyzer:
             
         Returns:
             Analysis result with modules, files, and dependencies
+            
+        Results are memoized: when no scanned file was added, removed or
+        modified (and .git/HEAD is unchanged), the previous result is returned
+        without reading any file. Results are also persisted in cache_dir, so
+        this holds across server restarts for up to ANALYSIS_DISK_CACHE_TTL.
         """
+        # One analyzer may be shared by several tools running in worker threads
+        with self._lock:
+            return self._analyze(source_path, include_patterns, exclude_patterns)
+    
+    def _analyze(
+        self,
+        source_path: str,
+        include_patterns: Optional[List[str]],
+        exclude_patterns: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Analyze a directory; callers must hold self._lock."""
         self.files = []
         self.modules = {}
         self.dependencies = {}
@@ -142,8 +322,56 @@ class CodeAnalyzer:
                 "message": f"Source path is not a directory: {source_path}"
             }
         
-        # Scan all files
-        self._scan_directory(source, source, include_patterns, exclude_patterns)
+        # Scan all files (stat only), then reuse a prior analysis of the same tree
+        candidates = self._scan_directory(
+            os.path.abspath(source_path), include_patterns, exclude_patterns
+        )
+        cache_key = (
+            os.path.abspath(source_path),
+            tuple(include_patterns or ()),
+            tuple(exclude_patterns or ()),
+            self._fingerprint(str(source), candidates)
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            result, self.files, self.modules, self.dependencies = cached
+            return result
+        
+        # Then a result persisted by an earlier run
+        disk_path = self._disk_cache_path(cache_key)
+        result = self._load_disk_cache(disk_path)
+        if result is not None:
+            self.files = [FileInfo(**f) for f in result["files"]]
+            self._build_module_hierarchy()
+            self.dependencies = result["dependencies"]
+            self._remember(cache_key, result)
+            return result
+        
+        # Reuse line counts and imports of files unchanged since they were last
+        # analyzed, count lines of other files that are not parsed in bulk,
+        # then read the remaining files in parallel (map yields them in scan order)
+        file_index = self._load_file_index()
+        known = {}
+        for path, _, _, _, stat in candidates:
+            entry = file_index.get(path)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                known[path] = (entry[2], entry[3])
+        line_counts = _count_lines_batch([
+            c[0] for c in candidates if c[0] not in known and not self._extracts_imports(c[3])
+        ])
+        known.update((path, (lines, [])) for path, lines in line_counts.items())
+        with ThreadPoolExecutor(max_workers=ANALYZE_WORKERS) as executor:
+            read = executor.map(
+                lambda c: self._analyze_file(*c),
+                [c for c in candidates if c[0] not in known]
+            )
+            analyzed = [
+                (c[0], c[4], self._analyze_file(*c, *known[c[0]]) if c[0] in known else next(read))
+                for c in candidates
+            ]
+        self.files = [f for _, _, f in analyzed if f is not None]
+        self._update_file_index(analyzed)
         
         # Analyze dependencies
         self._analyze_dependencies()
@@ -151,7 +379,7 @@ class CodeAnalyzer:
         # Build module hierarchy
         self._build_module_hierarchy()
         
-        return {
+        result = {
             "status": "success",
             "source_path": str(source.absolute()),
             "summary": {
@@ -163,92 +391,263 @@ class CodeAnalyzer:
             },
             "modules": {name: mod.to_dict() for name, mod in self.modules.items()},
             "files": [f.to_dict() for f in self.files],
-            "dependencies": {k: list(v) for k, v in self.dependencies.items()},
+            "dependencies": self.dependencies,
             "analyzed_at": datetime.now().isoformat()
         }
+        
+        self._remember(cache_key, result)
+        self._save_disk_cache(disk_path, result)
+        
+        return result
     
-    def _should_ignore(self, path: Path) -> bool:
-        """Check if a path should be ignored."""
-        for pattern in self.IGNORE_PATTERNS:
-            if pattern in str(path):
-                return True
-        return False
+    def _remember(self, cache_key: Tuple, result: Dict[str, Any]):
+        """Memoize a result together with the current files, modules and dependencies."""
+        self._analysis_cache[cache_key] = (result, self.files, self.modules, self.dependencies)
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+    
+    def _load_file_index(self) -> OrderedDict:
+        """Return the per-file index, reading the persisted one on first use."""
+        if self._file_index is None:
+            self._file_index = OrderedDict()
+            if self.cache_dir is not None:
+                try:
+                    with open(self.cache_dir / FILE_INDEX_NAME, 'r', encoding='utf-8') as f:
+                        self._file_index.update(json.load(f))
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    logger.debug("Ignoring file index: %s", e)
+        return self._file_index
+    
+    def _update_file_index(self, analyzed: List[Tuple[str, os.stat_result, Optional[FileInfo]]]):
+        """Record the analyzed files (most recent last), trim the index and persist it if it changed."""
+        file_index = self._load_file_index()
+        changed = False
+        for path, stat, info in analyzed:
+            old = file_index.pop(path, None)
+            if info is not None:
+                entry = [stat.st_mtime_ns, stat.st_size, info.lines, info.imports]
+                file_index[path] = entry
+                changed = changed or entry != old
+            else:
+                changed = changed or old is not None
+        while len(file_index) > FILE_INDEX_SIZE:
+            file_index.popitem(last=False)
+            changed = True
+        
+        if changed and self.cache_dir is not None:
+            self._write_json(self.cache_dir / FILE_INDEX_NAME, file_index)
+    
+    def _disk_cache_entries(self) -> List[Path]:
+        """List the persisted analysis results."""
+        if self.cache_dir is None:
+            return []
+        try:
+            return [p for p in self.cache_dir.glob("*.json") if p.name != FILE_INDEX_NAME]
+        except OSError:
+            return []
+    
+    def _disk_cache_path(self, cache_key: Tuple) -> Optional[Path]:
+        """Path of the persisted result for a cache key (None when disabled)."""
+        if self.cache_dir is None:
+            return None
+        name = hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{name}.json"
+    
+    def _load_disk_cache(self, path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Load a persisted result, unless it is missing, expired or unreadable."""
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > ANALYSIS_DISK_CACHE_TTL:
+                path.unlink()
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring analysis cache %s: %s", path, e)
+            return None
+    
+    def _save_disk_cache(self, path: Optional[Path], result: Dict[str, Any]):
+        """Persist a result and drop expired entries (best effort)."""
+        if path is None or not self._write_json(path, result):
+            return
+        
+        expiry = time.time() - ANALYSIS_DISK_CACHE_TTL
+        for entry in self._disk_cache_entries():
+            try:
+                if entry.stat().st_mtime < expiry:
+                    entry.unlink()
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> bool:
+        """Write JSON through a temporary file and rename, so readers never see partial data."""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # json.dumps encodes in C; json.dump streams through the Python encoder
+            payload = json.dumps(data, separators=(',', ':'))
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write analysis cache %s: %s", path, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+    
+    @staticmethod
+    def _fingerprint(root: str, candidates: List[Tuple[str, str, str, str, os.stat_result]]) -> bytes:
+        """Digest the scanned files' paths, sizes and mtimes, plus .git/HEAD if present."""
+        digest = hashlib.blake2b(digest_size=16)
+        for _, rel_path, _, _, stat in candidates:
+            digest.update(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+        try:
+            head = os.stat(os.path.join(root, '.git', 'HEAD'))
+            digest.update(f"HEAD\0{head.st_mtime_ns}".encode())
+        except OSError:
+            pass
+        return digest.digest()
+    
+    def _extracts_imports(self, ext: str) -> bool:
+        """Check if files with this extension are parsed for imports."""
+        return ext == '.py' or ext in self.JS_EXTENSIONS
+    
+    def _should_ignore(self, name: str) -> bool:
+        """Check if a directory entry should be ignored, by its name."""
+        return name in self.IGNORE_NAMES or name.endswith(self.IGNORE_SUFFIXES)
     
     def _scan_directory(
         self,
-        directory: Path,
-        root: Path,
+        root: str,
         include_patterns: Optional[List[str]],
         exclude_patterns: Optional[List[str]]
-    ):
-        """Recursively scan a directory for code files."""
+    ) -> List[Tuple[str, str, str, str, os.stat_result]]:
+        """
+        Scan a directory tree for code files, depth first in directory order.
+        
+        Uses an explicit stack of os.scandir iterators, so file types come from
+        the directory entries and each file is stat'ed only once.
+        
+        Returns:
+            (path, path relative to root, name, extension, stat) for every
+            file of a known type to analyze
+        """
+        prefix_len = len(os.path.join(root, ''))
+        candidates = []
+        stack = []
         try:
-            for item in directory.iterdir():
-                if self._should_ignore(item):
+            stack.append(os.scandir(root))
+        except PermissionError:
+            logger.warning("Permission denied: %s", root)
+        
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop().close()
+                continue
+            
+            # Ignored directories are never opened, so their subtrees are pruned
+            if self._should_ignore(entry.name):
+                continue
+            
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    stack.append(os.scandir(entry.path))
+                except PermissionError:
+                    logger.warning("Permission denied: %s", entry.path)
+            elif entry.is_file():
+                # Only process known file types
+                name = entry.name
+                dot = name.rfind('.')
+                ext = name[dot:].lower() if dot > 0 else ''
+                if ext not in self.ALL_EXTENSIONS:
                     continue
                 
-                if item.is_dir():
-                    self._scan_directory(item, root, include_patterns, exclude_patterns)
-                elif item.is_file():
-                    # Check patterns
+                # Check patterns
+                if include_patterns or exclude_patterns:
+                    item = PurePath(entry.path)
                     if include_patterns:
                         if not any(item.match(p) for p in include_patterns):
                             continue
                     if exclude_patterns:
                         if any(item.match(p) for p in exclude_patterns):
                             continue
-                    
-                    # Process file
-                    file_info = self._analyze_file(item, root)
-                    if file_info:
-                        self.files.append(file_info)
-        except PermissionError:
-            logger.warning(f"Permission denied: {directory}")
-    
-    def _analyze_file(self, file_path: Path, root: Path) -> Optional[FileInfo]:
-        """Analyze a single file."""
-        ext = file_path.suffix.lower()
+                
+                # Queue file for analysis
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.error("Error analyzing file %s: %s", entry.path, e)
+                    continue
+                candidates.append((entry.path, entry.path[prefix_len:], name, ext, stat))
         
-        # Only process known file types
-        all_extensions = (
-            set(self.CODE_EXTENSIONS.keys()) | 
-            self.CONFIG_EXTENSIONS | 
-            self.DOC_EXTENSIONS
-        )
-        if ext not in all_extensions:
-            return None
+        return candidates
+    
+    def _analyze_file(
+        self,
+        file_path: str,
+        rel_path: str,
+        name: str,
+        ext: str,
+        stat: os.stat_result,
+        lines: Optional[int] = None,
+        imports: Optional[List[str]] = None
+    ) -> Optional[FileInfo]:
+        """
+        Analyze a single file.
         
+        Args:
+            file_path: Path to the file
+            rel_path: Path of the file relative to the scanned root
+            name: File name
+            ext: Lower-cased file extension (a known type)
+            stat: The file's stat result, as cached by the directory scan
+            lines: Line count, when already known
+            imports: Imports, when already known (files that are not parsed
+                need only their line count)
+        """
         try:
-            # Get basic info
-            stat = file_path.stat()
-            rel_path = file_path.relative_to(root)
-            
             # Determine module (parent directory)
-            if len(rel_path.parts) > 1:
-                module = rel_path.parts[0]
-            else:
+            module, sep, _ = rel_path.partition(os.sep)
+            if not sep:
                 module = "root"
             
-            # Count lines and extract imports
-            lines = 0
-            imports = []
-            
+            # Count lines and extract imports, unless already known
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    lines = len(content.splitlines())
+                if self._extracts_imports(ext) and (lines is None or imports is None):
+                    # Imports sit at the top of a file, so only its head is
+                    # decoded and searched (cut at a line end when truncated)
+                    head, lines = _read_head_and_count_lines(file_path, IMPORT_SCAN_SIZE)
+                    if len(head) == IMPORT_SCAN_SIZE:
+                        head = head[:head.rfind(b'\n') + 1]
+                    content = head.decode('utf-8', errors='ignore')
                     
                     # Extract imports based on language
                     if ext == '.py':
                         imports = self._extract_python_imports(content)
-                    elif ext in ['.js', '.ts', '.jsx', '.tsx']:
+                    else:
                         imports = self._extract_js_imports(content)
+                elif lines is None:
+                    # Only the line count is needed, so skip decoding
+                    lines = _count_lines_bytes(file_path)
             except Exception as e:
-                logger.debug(f"Error reading file {file_path}: {e}")
+                logger.debug("Error reading file %s: %s", file_path, e)
+                lines = lines or 0
+            if imports is None:
+                imports = []
             
             return FileInfo(
-                path=str(rel_path),
-                name=file_path.name,
+                path=rel_path,
+                name=name,
                 extension=ext,
                 size=stat.st_size,
                 lines=lines,
@@ -257,67 +656,38 @@ class CodeAnalyzer:
                 modified=datetime.fromtimestamp(stat.st_mtime).isoformat()
             )
         except Exception as e:
-            logger.error(f"Error analyzing file {file_path}: {e}")
+            logger.error("Error analyzing file %s: %s", file_path, e)
             return None
     
     def _extract_python_imports(self, content: str) -> List[str]:
         """Extract import statements from Python code."""
-        imports = []
-        
-        # Match 'import xxx' and 'from xxx import yyy'
-        import_pattern = r'^(?:from\s+(\S+)\s+import|import\s+(\S+))'
-        
-        for line in content.splitlines():
-            line = line.strip()
-            match = re.match(import_pattern, line)
-            if match:
-                module = match.group(1) or match.group(2)
-                if module:
-                    # Get the top-level module
-                    top_module = module.split('.')[0]
-                    if top_module not in imports:
-                        imports.append(top_module)
-        
-        return imports
+        # Get the top-level module of each import, deduplicated in order of appearance
+        return list(dict.fromkeys(
+            (match.group(1) or match.group(2)).split('.')[0]
+            for match in PY_IMPORT_RE.finditer(content)
+        ))
     
     def _extract_js_imports(self, content: str) -> List[str]:
         """Extract import statements from JavaScript/TypeScript code."""
-        imports = []
-        
-        # Match various import patterns
-        patterns = [
-            r"import\s+.*?\s+from\s+['\"](.+?)['\"]",
-            r"require\s*\(\s*['\"](.+?)['\"]",
-        ]
+        imports = {}
         
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
+        for pattern in (JS_IMPORT_FROM_RE, JS_REQUIRE_RE):
+            for match in pattern.finditer(content):
                 module = match.group(1)
                 if module and not module.startswith('.'):
                     # Get the package name (first part)
-                    pkg = module.split('/')[0]
-                    if pkg not in imports:
-                        imports.append(pkg)
+                    imports[module.split('/')[0]] = None
         
-        return imports
+        return list(imports)
     
     def _analyze_dependencies(self):
         """Build dependency graph between files."""
-        # Group files by module
-        module_files = {}
-        for f in self.files:
-            if f.module not in module_files:
-                module_files[f.module] = []
-            module_files[f.module].append(f)
+        # Names of the modules that contain files
+        module_names = frozenset(f.module for f in self.files)
         
-        # Build dependencies based on imports
+        # Build dependencies based on imports (already unique per file)
         for f in self.files:
-            deps = set()
-            for imp in f.imports:
-                # Check if import matches any module
-                if imp in module_files:
-                    deps.add(imp)
-            
+            deps = [imp for imp in f.imports if imp in module_names]
             if deps:
                 self.dependencies[f.path] = deps
     
@@ -351,17 +721,7 @@ class CodeAnalyzer:
     
     def _count_by_type(self) -> Dict[str, int]:
         """Count files by type category."""
-        counts = {"code": 0, "config": 0, "docs": 0, "other": 0}
-        
-        for f in self.files:
-            ext = f.extension
-            if ext in self.CODE_EXTENSIONS:
-                counts["code"] += 1
-            elif ext in self.CONFIG_EXTENSIONS:
-                counts["config"] += 1
-            elif ext in self.DOC_EXTENSIONS:
-                counts["docs"] += 1
-            else:
-                counts["other"] += 1
-        
-        return counts
+        counts = Counter(
+            self.EXTENSION_CATEGORIES.get(f.extension, "other") for f in self.files
+        )
+        return {category: counts[category] for category in ("code", "config", "docs", "other")}
@@ -4,18 +4,108 @@ Handles Git operations for creating branches, commits, and pushing.
 """
 
 import os
+import re
+import sys
 import shutil
+import tempfile
 import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Linux ioctl request for a copy-on-write clone (reflink) of a whole file
+FICLONE = 0x40049409
+
+# Buffer size for the userspace fallback in copy_file
+COPY_BUFFER_SIZE = 1 << 20
+
+# git resolved once on PATH; spawning by absolute path skips the per-exec PATH search
+GIT_PATH = shutil.which("git") or "git"
+
+# Branches built concurrently, each in its own worktree
+BRANCH_WORKERS = (os.cpu_count() or 1) * 2
+
+# Branch names in `git ls-remote --heads` output
+REMOTE_HEAD_RE = re.compile(rb"\trefs/heads/(\S+)")
+
+# Seconds to answer remote branch checks from one ls-remote listing
+REMOTE_BRANCHES_TTL = 30
+
+# Per-branch lines of `git push --porcelain`: flag, branch, summary
+PUSH_STATUS_RE = re.compile(r"^(.)\t[^\t]*:refs/heads/([^\t]+)\t(.*)$", re.MULTILINE)
+
+
+def _copy_in_kernel(copy_chunk, fsrc, fdst, size: int) -> bool:
+    """
+    Copy size bytes with copy_chunk(dst_fd, src_fd, offset, count) -> bytes copied.
+    
+    Returns:
+        True if everything was copied; otherwise the destination is reset
+        so another method can start over
+    """
+    offset = 0
+    try:
+        while offset < size:
+            copied = copy_chunk(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        pass
+    if offset >= size:
+        return True
+    fdst.seek(0)
+    fdst.truncate()
+    return False
+
+
+def copy_file(src: str, dst: str) -> None:
+    """
+    Copy a file with content, mode and timestamps, avoiding userspace copies.
+    
+    Tries a reflink clone first, then os.copy_file_range, then os.sendfile,
+    and finally a buffered copy for platforms or filesystems that support none.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path (parent directory must exist)
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        st = os.fstat(fsrc.fileno())
+        copied = False
+        if fcntl is not None and sys.platform.startswith('linux'):
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                copied = True
+            except OSError:
+                pass
+        if not copied and hasattr(os, 'copy_file_range') and st.st_size:
+            copied = _copy_in_kernel(
+                lambda out_fd, in_fd, offset, count: os.copy_file_range(in_fd, out_fd, count, offset, offset),
+                fsrc, fdst, st.st_size
+            )
+        if not copied and hasattr(os, 'sendfile') and st.st_size:
+            copied = _copy_in_kernel(os.sendfile, fsrc, fdst, st.st_size)
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
 
-@dataclass
+
+@dataclass(slots=True)
 class BranchResult:
     """Result of a branch operation."""
     branch_name: str
@@ -34,26 +124,133 @@ class BranchResult:
         }
 
 
+class _GitBatchProc:
+    """A long-running `git cat-file --batch-check` that resolves names to object ids over pipes."""
+    
+    def __init__(self, cwd: str):
+        self.cwd = cwd
+        self._proc = subprocess.Popen(
+            [GIT_PATH, "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._lock = threading.Lock()
+    
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve a revision (branch, ref, HEAD, ...) like `git rev-parse --verify`.
+        
+        Returns:
+            The object id, or None if the name does not resolve
+            
+        Raises:
+            OSError: If the git process is gone
+        """
+        with self._lock:
+            self._proc.stdin.write(name.encode() + b"\n")
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+        if not line:
+            raise OSError("git cat-file exited")
+        
+        # "<objectname> <objecttype>", or "<name> missing" / "<name> ambiguous"
+        oid, _, kind = line.decode().rstrip("\n").rpartition(" ")
+        return oid if kind not in ("missing", "ambiguous") else None
+    
+    def close(self):
+        """End the process by closing its stdin."""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc.stdout.close()
+
+
 class GitManager:
     """Manages Git operations for PR splitting."""
     
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path).absolute()
+        
+        # Started on first lookup, for the current repo_path
+        self._batch: Optional[_GitBatchProc] = None
+        
+        # (repo path, remote) -> (monotonic timestamp, remote branch names),
+        # from prefetch_remote_branches
+        self._remote_branches: Dict[Tuple[str, str], Tuple[float, Set[str]]] = {}
+        
+        # Concurrent `git worktree add` can read another's half-written entry
+        self._worktree_lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Stop the persistent git process, if running."""
+        if self._batch is not None:
+            self._batch.close()
+            self._batch = None
+    
+    def _resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve a revision to an object id through the persistent git process,
+        falling back to `git rev-parse --verify` if it cannot be used.
+        """
+        cwd = str(self.repo_path)
+        try:
+            if self._batch is None or self._batch.cwd != cwd:
+                self.close()
+                self._batch = _GitBatchProc(cwd)
+            return self._batch.resolve(name)
+        except OSError as e:
+            logger.debug("git cat-file unavailable, using rev-parse: %s", e)
+            self.close()
+        
+        result = self._run_git("rev-parse", "--verify", "--quiet", name)
+        return result.stdout.strip() if result.returncode == 0 else None
     
-    def _run_git(self, *args, cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
-        """Run a git command."""
-        cmd = ["git"] + list(args)
-        return subprocess.run(
+    def _run_git(
+        self,
+        *args,
+        cwd: Optional[Path] = None,
+        input: Optional[Union[str, bytes]] = None,
+        capture: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command, optionally feeding ``input`` on stdin.
+        
+        Bytes input is passed through unencoded. With capture=False, for
+        commands run only for their effect, stdout is discarded (None) and
+        stderr is only decoded if the command fails ("" otherwise).
+        """
+        cmd = [GIT_PATH] + list(args)
+        if isinstance(input, str):
+            input = input.encode()
+        result = subprocess.run(
             cmd,
             cwd=cwd or self.repo_path,
-            capture_output=True,
-            text=True
+            input=input,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
+        if capture:
+            result.stdout = result.stdout.decode("utf-8", "replace")
+        if capture or result.returncode != 0:
+            result.stderr = result.stderr.decode("utf-8", "replace")
+        else:
+            result.stderr = ""
+        return result
     
     def is_git_repo(self, path: Optional[str] = None) -> bool:
         """Check if path is a git repository."""
         check_path = Path(path) if path else self.repo_path
-        result = self._run_git("rev-parse", "--git-dir", cwd=check_path)
+        result = self._run_git("rev-parse", "--git-dir", cwd=check_path, capture=False)
         return result.returncode == 0
     
     def get_current_branch(self) -> str:
@@ -66,19 +263,60 @@ class GitManager:
         result = self._run_git("remote", "get-url", remote)
         return result.stdout.strip() if result.returncode == 0 else ""
     
+    def prefetch_remote_branches(self, remote: str = "origin") -> Set[str]:
+        """
+        List the branches on a remote with one `git ls-remote` round trip.
+        
+        The result is kept for branch_exists(remote=True) calls on this
+        repository for REMOTE_BRANCHES_TTL seconds, or until the next push to
+        that remote. Nothing is kept if the remote cannot be reached.
+        
+        Args:
+            remote: Remote name
+            
+        Returns:
+            Names of the remote's branches
+        """
+        result = subprocess.run(
+            [GIT_PATH, "ls-remote", "--heads", remote],
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        if result.returncode != 0:
+            return set()
+        
+        branches = set(map(os.fsdecode, REMOTE_HEAD_RE.findall(result.stdout)))
+        self._remote_branches[(str(self.repo_path), remote)] = (time.monotonic(), branches)
+        return branches
+    
     def branch_exists(self, branch_name: str, remote: bool = False) -> bool:
         """Check if a branch exists."""
         if remote:
-            result = self._run_git("ls-remote", "--heads", "origin", branch_name)
-            return bool(result.stdout.strip())
+            # The manager may have been pointed at another repository since
+            cached = self._remote_branches.get((str(self.repo_path), "origin"))
+            if cached is not None and time.monotonic() - cached[0] < REMOTE_BRANCHES_TTL:
+                branches = cached[1]
+            else:
+                branches = self.prefetch_remote_branches("origin")
+            return branch_name in branches
         else:
-            result = self._run_git("rev-parse", "--verify", branch_name)
-            return result.returncode == 0
+            return self._resolve(branch_name) is not None
+    
+    def first_existing_branch(self, branch_names: Sequence[str]) -> Optional[str]:
+        """Return the first of branch_names that exists locally, looked up with one git call."""
+        if not branch_names:
+            return None
+        result = self._run_git(
+            "for-each-ref", "--format=%(refname)", *(f"refs/heads/{name}" for name in branch_names)
+        )
+        existing = set(result.stdout.split())
+        return next((name for name in branch_names if f"refs/heads/{name}" in existing), None)
     
     def create_branch(self, branch_name: str, base_branch: str = "main") -> Dict[str, Any]:
         """Create a new branch from base branch."""
         # First, make sure we're on the base branch and it's up to date
-        result = self._run_git("checkout", base_branch)
+        result = self._run_git("checkout", base_branch, capture=False)
         if result.returncode != 0:
             return {
                 "status": "error",
@@ -86,7 +324,7 @@ class GitManager:
             }
         
         # Create new branch
-        result = self._run_git("checkout", "-b", branch_name)
+        result = self._run_git("checkout", "-b", branch_name, capture=False)
         if result.returncode != 0:
             return {
                 "status": "error",
@@ -99,12 +337,19 @@ class GitManager:
             "base_branch": base_branch
         }
     
-    def add_files(self, files: List[str]) -> Dict[str, Any]:
-        """Add files to staging."""
+    def add_files(self, files: List[str], cwd: Optional[Path] = None) -> Dict[str, Any]:
+        """Add files to staging (in the worktree at cwd, if given)."""
         if not files:
             return {"status": "success", "files_added": 0}
         
-        result = self._run_git("add", *files)
+        # Feed the pathspecs on stdin so large batches never hit ARG_MAX, as
+        # file system bytes so names in any encoding reach git unchanged
+        result = self._run_git(
+            "add", "--pathspec-from-file=-", "--pathspec-file-nul",
+            cwd=cwd,
+            input=b"\0".join(map(os.fsencode, files)),
+            capture=False
+        )
         if result.returncode != 0:
             return {
                 "status": "error",
@@ -113,9 +358,9 @@ class GitManager:
         
         return {"status": "success", "files_added": len(files)}
     
-    def commit(self, message: str) -> Dict[str, Any]:
-        """Create a commit."""
-        result = self._run_git("commit", "-m", message)
+    def commit(self, message: str, cwd: Optional[Path] = None) -> Dict[str, Any]:
+        """Create a commit (in the worktree at cwd, if given)."""
+        result = self._run_git("commit", "-m", message, cwd=cwd)
         if result.returncode != 0:
             # Check if there's nothing to commit
             if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
@@ -128,9 +373,12 @@ class GitManager:
                 "message": f"Failed to commit: {result.stderr}"
             }
         
-        # Get commit hash
-        hash_result = self._run_git("rev-parse", "HEAD")
-        commit_hash = hash_result.stdout.strip() if hash_result.returncode == 0 else None
+        # Get commit hash (HEAD is per worktree, so other worktrees ask git directly)
+        if cwd is None:
+            commit_hash = self._resolve("HEAD")
+        else:
+            hash_result = self._run_git("rev-parse", "HEAD", cwd=cwd)
+            commit_hash = hash_result.stdout.strip() if hash_result.returncode == 0 else None
         
         return {
             "status": "success",
@@ -138,12 +386,19 @@ class GitManager:
         }
     
     def push(self, branch_name: str, remote: str = "origin", force: bool = False) -> Dict[str, Any]:
-        """Push branch to remote."""
+        """
+        Push branch to remote.
+        
+        Progress output is discarded and stderr is only decoded if the push
+        fails. force overwrites the remote branch only if it is still where
+        our remote-tracking branch last saw it (--force-with-lease).
+        """
         args = ["push", "-u", remote, branch_name]
         if force:
-            args.insert(1, "--force")
+            args.insert(1, "--force-with-lease")
         
-        result = self._run_git(*args)
+        self._remote_branches.pop((str(self.repo_path), remote), None)
+        result = self._run_git(*args, capture=False)
         if result.returncode != 0:
             return {
                 "status": "error",
@@ -156,9 +411,188 @@ class GitManager:
             "remote": remote
         }
     
+    def push_branches(self, branch_names: List[str], remote: str = "origin") -> Dict[str, Dict[str, Any]]:
+        """
+        Push several branches to remote over a single connection.
+        
+        The push is atomic where the remote supports it. If the atomic push
+        fails, because the remote does not support it or one branch was
+        rejected, the branches are pushed again without --atomic and each
+        one's outcome is read from git's porcelain output.
+        
+        Args:
+            branch_names: Branches to push
+            remote: Remote name
+            
+        Returns:
+            Push result per branch name
+        """
+        if not branch_names:
+            return {}
+        
+        self._remote_branches.pop((str(self.repo_path), remote), None)
+        result = self._run_git("push", "--atomic", "-u", remote, *branch_names, capture=False)
+        if result.returncode != 0:
+            result = self._run_git("push", "--porcelain", "-u", remote, *branch_names)
+        if result.returncode == 0:
+            return {
+                name: {"status": "success", "branch_name": name, "remote": remote}
+                for name in branch_names
+            }
+        
+        # Nothing was pushed if git reported no branch (e.g. one of them does
+        # not exist locally), so push each on its own to attribute the error
+        statuses = PUSH_STATUS_RE.findall(result.stdout)
+        if not statuses:
+            return {name: self.push(name, remote) for name in branch_names}
+        
+        results = {
+            name: {"status": "error", "message": f"Failed to push: {result.stderr}"}
+            for name in branch_names
+        }
+        for flag, branch, summary in statuses:
+            if branch not in results:
+                continue
+            if flag == "!":
+                results[branch] = {"status": "error", "message": f"Failed to push: {summary}"}
+            else:
+                results[branch] = {"status": "success", "branch_name": branch, "remote": remote}
+        return results
+    
+    def build_branches(
+        self,
+        base_branch: str,
+        jobs: Sequence[Tuple[str, str, Sequence[Tuple[str, str]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one branch per job from base_branch and commit the job's files to it.
+        
+        Branches are built concurrently, each in its own temporary worktree
+        sharing this repository's objects, so the main working tree, its
+        index and HEAD are never touched. The worktrees are not checked out:
+        only the index is loaded from base_branch before the files are added.
+        
+        Args:
+            base_branch: Branch every new branch starts from
+            jobs: (branch name, commit message, [(path in repo, source file path)])
+            
+        Returns:
+            Per job, in order: status ("success", "warning" when no file
+            was copied, or "error"), files_added, commit_hash and message
+        """
+        if not jobs:
+            return []
+        
+        # Without a base every `worktree add` would fail the same way (a
+        # fresh rev-parse: the persistent lookup may predate the base commit)
+        if self._run_git("rev-parse", "--verify", "--quiet", f"{base_branch}^{{commit}}").returncode != 0:
+            return [
+                {"status": "error", "files_added": 0, "message": f"Base branch not found: {base_branch}"}
+                for _ in jobs
+            ]
+        
+        # A branch named twice would be built by whichever thread wins, so
+        # only the first job of a name runs, as if they ran in order
+        first_index = {}
+        for i, (branch_name, _, _) in enumerate(jobs):
+            first_index.setdefault(branch_name, i)
+        
+        def build(i: int) -> Dict[str, Any]:
+            branch_name, message, file_pairs = jobs[i]
+            if first_index[branch_name] != i:
+                return {
+                    "status": "error",
+                    "files_added": 0,
+                    "message": f"Failed to create branch {branch_name}: already created by this split"
+                }
+            return self._build_branch(
+                base_branch, os.path.join(tmp_root, str(i)), branch_name, message, file_pairs
+            )
+        
+        tmp_root = tempfile.mkdtemp(prefix="pr-splitter-wt-")
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), BRANCH_WORKERS)) as executor:
+                return list(executor.map(build, range(len(jobs))))
+        finally:
+            self._run_git("worktree", "prune", capture=False)
+            shutil.rmtree(tmp_root, ignore_errors=True)
+    
+    def _build_branch(
+        self,
+        base_branch: str,
+        worktree: str,
+        branch_name: str,
+        message: str,
+        file_pairs: Sequence[Tuple[str, str]]
+    ) -> Dict[str, Any]:
+        """Build one branch of build_branches in a new worktree at the given path."""
+        with self._worktree_lock:
+            result = self._run_git("worktree", "add", "-q", "--no-checkout", "-b", branch_name, worktree, base_branch, capture=False)
+        if result.returncode != 0:
+            return {
+                "status": "error",
+                "files_added": 0,
+                "message": f"Failed to create branch {branch_name}: {result.stderr}"
+            }
+        
+        # Status of the build; a branch whose build failed is deleted again
+        status = "error"
+        try:
+            result = self._run_git("read-tree", "HEAD", cwd=worktree, capture=False)
+            if result.returncode != 0:
+                return {
+                    "status": "error",
+                    "files_added": 0,
+                    "message": f"Failed to load {base_branch} into the index: {result.stderr}"
+                }
+            
+            # Copy files from source to the worktree, creating each parent once;
+            # missing sources are skipped by the failed open, not a stat per file
+            copied_files = []
+            created_dirs = set()
+            for file_path, src_file in file_pairs:
+                dst_file = os.path.join(worktree, file_path)
+                parent = os.path.dirname(dst_file)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                try:
+                    copy_file(src_file, dst_file)
+                except FileNotFoundError:
+                    continue
+                copied_files.append(file_path)
+            
+            if not copied_files:
+                status = "warning"
+                return {"status": "warning", "files_added": 0, "message": "No files copied"}
+            
+            # Add and commit
+            add_result = self.add_files(copied_files, cwd=worktree)
+            if add_result.get("status") == "error":
+                return {"status": "error", "files_added": 0, "message": add_result.get("message")}
+            commit_result = self.commit(message, cwd=worktree)
+            status = commit_result["status"]
+            if status != "success":
+                # A rejected commit (e.g. a failing hook or no user identity)
+                # or files identical to base would leave the branch at base
+                return {"status": status, "files_added": 0, "message": commit_result.get("message")}
+            
+            return {
+                "status": "success",
+                "files_added": len(copied_files),
+                "commit_hash": commit_result.get("commit_hash"),
+                "message": None
+            }
+        finally:
+            with self._worktree_lock:
+                self._run_git("worktree", "remove", "--force", worktree, capture=False)
+            if status == "error":
+                # So a retry does not fail on "branch exists"
+                self._run_git("branch", "-D", branch_name, capture=False)
+    
     def checkout(self, branch_name: str) -> Dict[str, Any]:
         """Checkout a branch."""
-        result = self._run_git("checkout", branch_name)
+        result = self._run_git("checkout", branch_name, capture=False)
         if result.returncode != 0:
             return {
                 "status": "error",
@@ -187,7 +621,6 @@ class GitManager:
             Execution result with created branches
         """
         self.repo_path = Path(target_repo_path).absolute()
-        source = Path(source_path).absolute()
         
         if not self.is_git_repo():
             return {
@@ -201,87 +634,82 @@ class GitManager:
         # First, ensure base branch exists and we're on it
         if not dry_run:
             checkout_result = self.checkout(base_branch)
-            if checkout_result.get("status") == "error":
-                # Try to create it from main/master
-                for fallback in ["main", "master"]:
-                    result = self.create_branch(base_branch, fallback)
-                    if result.get("status") == "success":
-                        break
-        
-        # Process each PR in the plan
-        for pr in plan.get("prs", []):
-            branch_name = pr.get("branch_name", "")
-            files = pr.get("files", [])
-            description = pr.get("description", "")
-            
-            if dry_run:
-                results.append(BranchResult(
-                    branch_name=branch_name,
+            if checkout_result.get("status") == "error" and not self.branch_exists(f"refs/heads/{base_branch}"):
+                # Create it from main/master, whichever exists
+                fallback = self.first_existing_branch(["main", "master"])
+                if fallback:
+                    self.create_branch(base_branch, fallback)
+        
+        prs = plan.get("prs", [])
+        if dry_run:
+            results = [
+                BranchResult(
+                    branch_name=pr.get("branch_name", ""),
                     status="dry_run",
-                    files_added=len(files)
-                ))
-                continue
-            
-            # Create branch from base
-            branch_result = self.create_branch(branch_name, base_branch)
-            if branch_result.get("status") == "error":
-                results.append(BranchResult(
-                    branch_name=branch_name,
-                    status="error",
-                    files_added=0,
-                    error=branch_result.get("message")
-                ))
-                continue
-            
-            # Copy files from source to target
-            copied_files = []
-            for file_path in files:
-                src_file = source / file_path
-                dst_file = self.repo_path / file_path
-                
-                if src_file.exists():
-                    # Create parent directories
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file
-                    shutil.copy2(src_file, dst_file)
-                    copied_files.append(file_path)
-            
-            if not copied_files:
+                    files_added=len(pr.get("files", []))
+                )
+                for pr in prs
+            ]
+        else:
+            # Build all branches in parallel worktrees
+            source_str = os.path.abspath(source_path)
+            jobs = [
+                (
+                    pr.get("branch_name", ""),
+                    f"feat: {pr.get('description', '')}",
+                    [(f, os.path.join(source_str, f)) for f in pr.get("files", [])]
+                )
+                for pr in prs
+            ]
+            built = self.build_branches(base_branch, jobs)
+            results = self._push_built_branches(jobs, built)
+        
+        return self._split_result(results, dry_run)
+    
+    def _push_built_branches(
+        self,
+        jobs: Sequence[Tuple[str, str, Sequence[Tuple[str, str]]]],
+        built: List[Dict[str, Any]]
+    ) -> List[BranchResult]:
+        """Push every branch that got files in one round trip and combine both results."""
+        push_results = self.push_branches([
+            name for (name, _, _), b in zip(jobs, built) if b["status"] == "success"
+        ])
+        
+        results = []
+        for (branch_name, _, _), b in zip(jobs, built):
+            if b["status"] != "success":
                 results.append(BranchResult(
                     branch_name=branch_name,
-                    status="warning",
+                    status=b["status"],
                     files_added=0,
-                    error="No files copied"
+                    error=b.get("message")
                 ))
                 continue
             
-            # Add and commit
-            self.add_files(copied_files)
-            commit_result = self.commit(f"feat: {description}")
-            
-            # Push
-            push_result = self.push(branch_name)
-            
+            push_result = push_results[branch_name]
+            pushed = push_result.get("status") == "success"
             results.append(BranchResult(
                 branch_name=branch_name,
-                status="success" if push_result.get("status") == "success" else "partial",
-                files_added=len(copied_files),
-                commit_hash=commit_result.get("commit_hash"),
-                error=push_result.get("message") if push_result.get("status") != "success" else None
+                status="success" if pushed else "partial",
+                files_added=b["files_added"],
+                commit_hash=b.get("commit_hash"),
+                error=None if pushed else push_result.get("message")
             ))
-            
-            # Go back to base branch for next iteration
-            self.checkout(base_branch)
-        
+        return results
+    
+    @staticmethod
+    def _split_result(results: List[BranchResult], dry_run: bool) -> Dict[str, Any]:
+        """Build the execute_split result from its branch results."""
+        statuses = Counter(r.status for r in results)
         return {
             "status": "success",
             "dry_run": dry_run,
-            "branches": [r.to_dict() for r in results],
+            "branches": list(map(BranchResult.to_dict, results)),
             "summary": {
                 "total_branches": len(results),
-                "successful": len([r for r in results if r.status == "success"]),
-                "failed": len([r for r in results if r.status == "error"]),
+                "successful": statuses["success"],
+                "failed": statuses["error"],
             },
             "executed_at": datetime.now().isoformat()
         }
@@ -9,14 +9,46 @@ Authentication Flow (same as coding-flow):
 """
 
 import os
+import time
+import asyncio
+import shutil
+import threading
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from azure.devops.v7_0.git.models import GitPullRequest, ResourceRef
+except ImportError:  # Optional; reported when an ADO PR is created
+    GitPullRequest = ResourceRef = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of PRs created concurrently from one plan
+PR_CREATE_WORKERS = 8
+
+# Seconds a token from `gh auth token` is reused before gh is asked again
+GH_TOKEN_TTL = 300
+
+# Seconds to wait for `gh auth token`
+GH_TOKEN_TIMEOUT = 2
+
+# GitHub REST API root used by GitHubAsyncClient
+GITHUB_API_URL = "https://api.github.com"
+
+# Seconds before an ADO token expires at which the connection is re-authenticated
+ADO_TOKEN_REFRESH_MARGIN = 60
+
+# gh executable, resolved once
+GH_PATH = shutil.which("gh")
+
+# (token, time.monotonic() it was fetched) from the last successful `gh auth token`
+_gh_token_cache: Optional[tuple] = None
+_gh_token_lock = threading.Lock()
+
 
 def _get_github_token() -> Optional[str]:
     """
@@ -25,24 +57,33 @@ def _get_github_token() -> Optional[str]:
     2. Try GITHUB_TOKEN env var  
     3. Try `gh auth token` command
     """
+    global _gh_token_cache
+    
     # Check environment variables first
     token = os.environ.get("GITHUB_PAT_TOKEN") or os.environ.get("GITHUB_TOKEN")
     if token:
         logger.debug("Using GitHub token from environment variable")
         return token
     
-    # Try gh CLI
-    try:
-        result = subprocess.run(
-            ["gh", "auth", "token"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            logger.debug("Using GitHub token from gh auth")
-            return result.stdout.strip()
-    except FileNotFoundError:
-        pass
+    # Try gh CLI, reusing its token for GH_TOKEN_TTL so rotation is still seen
+    if GH_PATH is None:
+        return None
+    with _gh_token_lock:
+        if _gh_token_cache is not None and time.monotonic() - _gh_token_cache[1] < GH_TOKEN_TTL:
+            return _gh_token_cache[0]
+        try:
+            result = subprocess.run(
+                [GH_PATH, "auth", "token"],
+                capture_output=True,
+                text=True,
+                timeout=GH_TOKEN_TIMEOUT
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                logger.debug("Using GitHub token from gh auth")
+                _gh_token_cache = (result.stdout.strip(), time.monotonic())
+                return _gh_token_cache[0]
+        except (OSError, subprocess.TimeoutExpired):
+            pass
     
     return None
 
@@ -91,31 +132,43 @@ class AzureDevOpsClient:
     
     def __init__(self, org_url: str):
         self.org_url = org_url.rstrip('/')
+        self._credential = None
         self._connection = None
         self._git_client = None
+        self._token_expires_on = 0
+        
+        # PRs may be created from several threads; only one authenticates
+        self._lock = threading.RLock()
     
     def _get_connection(self):
-        """Get or create ADO connection using Azure CLI credentials."""
-        if self._connection is not None:
-            return self._connection
-        
+        """Get or create ADO connection using Azure CLI credentials, renewing it before the token expires."""
+        with self._lock:
+            if self._connection is not None and time.time() < self._token_expires_on - ADO_TOKEN_REFRESH_MARGIN:
+                return self._connection
+            return self._connect()
+    
+    def _connect(self):
+        """Authenticate and create a new connection; callers must hold self._lock."""
         try:
             from azure.devops.connection import Connection
             from azure.identity import ChainedTokenCredential, AzureCliCredential, InteractiveBrowserCredential
             from msrest.authentication import BasicTokenAuthentication
             
             # Same pattern as coding-flow: try CLI first, then browser
-            credential = ChainedTokenCredential(
-                AzureCliCredential(),
-                InteractiveBrowserCredential()
-            )
+            if self._credential is None:
+                self._credential = ChainedTokenCredential(
+                    AzureCliCredential(),
+                    InteractiveBrowserCredential()
+                )
             
             # Get token for Azure DevOps
-            token = credential.get_token(self.ADO_RESOURCE_ID)
+            token = self._credential.get_token(self.ADO_RESOURCE_ID)
             
             # Create connection with the token
             credentials = BasicTokenAuthentication({'access_token': token.token})
             self._connection = Connection(base_url=self.org_url, creds=credentials)
+            self._token_expires_on = token.expires_on
+            self._git_client = None
             
             return self._connection
         except ImportError as e:
@@ -127,13 +180,12 @@ class AzureDevOpsClient:
             raise RuntimeError(f"Failed to authenticate with Azure DevOps: {e}") from e
     
     def _get_git_client(self):
-        """Get Git client."""
-        if self._git_client is not None:
+        """Get Git client (recreated with the connection when the token is renewed)."""
+        with self._lock:
+            connection = self._get_connection()
+            if self._git_client is None:
+                self._git_client = connection.clients.get_git_client()
             return self._git_client
-        
-        connection = self._get_connection()
-        self._git_client = connection.clients.get_git_client()
-        return self._git_client
     
     def create_pull_request(
         self,
@@ -148,10 +200,11 @@ class AzureDevOpsClient:
     ) -> PRResult:
         """Create a pull request in Azure DevOps."""
         try:
-            from azure.devops.v7_0.git.models import (
-                GitPullRequest,
-                ResourceRef
-            )
+            if GitPullRequest is None:
+                raise ImportError(
+                    "Required packages not installed. Run:\n"
+                    "pip install azure-devops azure-identity msrest"
+                )
             
             git_client = self._get_git_client()
             
@@ -295,6 +348,86 @@ class GitHubClient:
             )
 
 
+class GitHubAsyncClient:
+    """
+    GitHub client for batch PR creation over the REST API with httpx.
+    
+    One client holds one connection pool, so a batch of PRs shares its TLS
+    connections instead of handshaking per PR. Use it as an async context
+    manager; the token comes from the same resolution as GitHubClient.
+    """
+    
+    def __init__(self, token: str, max_connections: int = PR_CREATE_WORKERS):
+        import httpx
+        
+        self._client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28"
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+    
+    async def create_pull_request(
+        self,
+        repo: str,
+        source_branch: str,
+        target_branch: str = "main",
+        title: str = "",
+        body: str = "",
+        draft: bool = True
+    ) -> PRResult:
+        """Create a pull request in GitHub."""
+        try:
+            response = await self._client.post(
+                f"/repos/{repo}/pulls",
+                json={
+                    "title": title or f"PR: {source_branch}",
+                    "body": body,
+                    "head": source_branch,
+                    "base": target_branch,
+                    "draft": draft
+                }
+            )
+            if response.status_code != 201:
+                raise RuntimeError(f"{response.status_code} {response.text}")
+            pr = response.json()
+            
+            logger.info("Created GitHub PR #%s: %s", pr["number"], pr["html_url"])
+            
+            return PRResult(
+                platform="github",
+                pr_id=str(pr["number"]),
+                pr_url=pr["html_url"],
+                status="success",
+                branch_name=source_branch,
+                title=title or source_branch
+            )
+            
+        except Exception as e:
+            logger.error("Failed to create GitHub PR: %s", e)
+            return PRResult(
+                platform="github",
+                pr_id=None,
+                pr_url=None,
+                status="error",
+                branch_name=source_branch,
+                title=title or source_branch,
+                error=str(e)
+            )
+
+
 class PRCreator:
     """
     Professional PR Creator using native SDKs.
@@ -512,74 +645,188 @@ class PRCreator:
         Returns:
             Results of PR creation
         """
-        results = []
         prs = plan.get("prs", [])
         base_branch = plan.get("base_branch", "main")
+        if not prs:
+            return self.summarize_results(platform, [])
         
-        for pr_def in prs:
-            branch_name = pr_def.get("branch_name", "")
-            title = pr_def.get("name", f"PR for {branch_name}")
-            description = pr_def.get("description", "")
-            
-            if platform == "ado":
-                if not org_url or not project or not repo:
-                    results.append(PRResult(
-                        platform="ado",
-                        pr_id=None,
-                        pr_url=None,
-                        status="error",
-                        branch_name=branch_name,
-                        title=title,
-                        error="Missing required ADO parameters (org_url, project, repo)"
-                    ))
-                    continue
+        # Each PR is one independent API round trip, so run them concurrently
+        # (map keeps plan order) once the shared client is authenticated
+        self.prepare_client(platform, org_url)
+        with ThreadPoolExecutor(max_workers=min(PR_CREATE_WORKERS, len(prs))) as executor:
+            results = list(executor.map(
+                lambda pr_def: self.create_pr_for_definition(
+                    pr_def, platform, base_branch,
+                    org_url=org_url, project=project, repo=repo, draft=draft
+                ),
+                prs
+            ))
+        return self.summarize_results(platform, results)
+    
+    async def create_prs_from_plan_async(
+        self,
+        plan: Dict[str, Any],
+        platform: str,
+        org_url: Optional[str] = None,
+        project: Optional[str] = None,
+        repo: str = "",
+        draft: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_prs_from_plan, creating up to
+        PR_CREATE_WORKERS PRs at a time.
+        
+        GitHub PRs are posted through one GitHubAsyncClient, so the batch
+        shares its connections; without httpx, and for Azure DevOps, the
+        SDK calls run in worker threads.
+        """
+        prs = plan.get("prs", [])
+        base_branch = plan.get("base_branch", "main")
+        semaphore = asyncio.Semaphore(PR_CREATE_WORKERS)
+        
+        token = None
+        if platform == "github" and repo and prs:
+            try:
+                import httpx  # noqa: F401
+                token = await asyncio.to_thread(_get_github_token)
+            except ImportError:
+                pass
+        
+        if token:
+            async with GitHubAsyncClient(token) as client:
+                async def create_one(pr_def: Dict[str, Any]) -> PRResult:
+                    branch_name = pr_def.get("branch_name", "")
+                    async with semaphore:
+                        return await client.create_pull_request(
+                            repo=repo,
+                            source_branch=branch_name,
+                            target_branch=base_branch,
+                            title=pr_def.get("name", f"PR for {branch_name}"),
+                            body=pr_def.get("description", ""),
+                            draft=draft
+                        )
                 
-                result = self.create_ado_pr(
+                results = await asyncio.gather(*(create_one(pr_def) for pr_def in prs))
+            return self.summarize_results(platform, results)
+        
+        async def create_one_in_thread(pr_def: Dict[str, Any]) -> PRResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.create_pr_for_definition,
+                    pr_def,
+                    platform,
+                    base_branch,
                     org_url=org_url,
                     project=project,
                     repo=repo,
-                    source_branch=branch_name,
-                    target_branch=base_branch,
-                    title=title,
-                    description=description,
                     draft=draft
                 )
-            elif platform == "github":
-                if not repo:
-                    results.append(PRResult(
-                        platform="github",
-                        pr_id=None,
-                        pr_url=None,
-                        status="error",
-                        branch_name=branch_name,
-                        title=title,
-                        error="Missing required GitHub repo parameter (format: owner/repo)"
-                    ))
-                    continue
-                
-                result = self.create_github_pr(
-                    repo=repo,
-                    source_branch=branch_name,
-                    target_branch=base_branch,
+        
+        # Authenticate once, then fan out (gather keeps plan order)
+        if prs:
+            await asyncio.to_thread(self.prepare_client, platform, org_url)
+        results = await asyncio.gather(*(create_one_in_thread(pr_def) for pr_def in prs))
+        return self.summarize_results(platform, results)
+    
+    def prepare_client(self, platform: str, org_url: Optional[str] = None):
+        """
+        Create and authenticate the platform client ahead of concurrent use,
+        so threads do not each fetch credentials. Failures are left for the
+        individual PR creations to report.
+        """
+        try:
+            if platform == "github":
+                self._get_github_client()._get_client()
+            elif platform == "ado" and org_url:
+                self._get_ado_client(org_url)._get_git_client()
+        except Exception as e:
+            logger.debug("Could not prepare %s client: %s", platform, e)
+    
+    def create_pr_for_definition(
+        self,
+        pr_def: Dict[str, Any],
+        platform: str,
+        base_branch: str,
+        org_url: Optional[str] = None,
+        project: Optional[str] = None,
+        repo: str = "",
+        draft: bool = True
+    ) -> PRResult:
+        """
+        Create the PR for a single PR definition of a split plan.
+        
+        Args:
+            pr_def: One entry of the plan's "prs" list
+            platform: Target platform ("ado" or "github")
+            base_branch: Branch the PR targets
+            org_url: Azure DevOps org URL (required for ADO)
+            project: Azure DevOps project name (required for ADO)
+            repo: Repository name (format: "owner/repo" for GitHub)
+            draft: Create as draft PR
+            
+        Returns:
+            Result of the PR creation
+        """
+        branch_name = pr_def.get("branch_name", "")
+        title = pr_def.get("name", f"PR for {branch_name}")
+        description = pr_def.get("description", "")
+        
+        if platform == "ado":
+            if not org_url or not project or not repo:
+                return PRResult(
+                    platform="ado",
+                    pr_id=None,
+                    pr_url=None,
+                    status="error",
+                    branch_name=branch_name,
                     title=title,
-                    body=description,
-                    draft=draft
+                    error="Missing required ADO parameters (org_url, project, repo)"
                 )
-            else:
-                results.append(PRResult(
-                    platform=platform,
+            
+            return self.create_ado_pr(
+                org_url=org_url,
+                project=project,
+                repo=repo,
+                source_branch=branch_name,
+                target_branch=base_branch,
+                title=title,
+                description=description,
+                draft=draft
+            )
+        elif platform == "github":
+            if not repo:
+                return PRResult(
+                    platform="github",
                     pr_id=None,
                     pr_url=None,
                     status="error",
                     branch_name=branch_name,
                     title=title,
-                    error=f"Unsupported platform: {platform}. Use 'ado' or 'github'"
-                ))
-                continue
+                    error="Missing required GitHub repo parameter (format: owner/repo)"
+                )
             
-            results.append(result)
+            return self.create_github_pr(
+                repo=repo,
+                source_branch=branch_name,
+                target_branch=base_branch,
+                title=title,
+                body=description,
+                draft=draft
+            )
         
-        # Summary
+        return PRResult(
+            platform=platform,
+            pr_id=None,
+            pr_url=None,
+            status="error",
+            branch_name=branch_name,
+            title=title,
+            error=f"Unsupported platform: {platform}. Use 'ado' or 'github'"
+        )
+    
+    @staticmethod
+    def summarize_results(platform: str, results: List[PRResult]) -> Dict[str, Any]:
+        """Build the batch creation summary for a list of PR results."""
         successful = [r for r in results if r.status == "success"]
         failed = [r for r in results if r.status == "error"]
         
@@ -4,17 +4,137 @@ Generates intelligent split plans for dividing code into multiple PRs.
 """
 
 import os
+import re
+import heapq
+import itertools
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import Iterator, List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
+import threading
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
 
-from .analyzer import CodeAnalyzer, FileInfo, ModuleInfo
+from .analyzer import ANALYSIS_CACHE_SIZE, CodeAnalyzer, FileInfo, ModuleInfo
 
 logger = logging.getLogger(__name__)
 
+# Balanced splits into at most this many PRs, over at most this many files,
+# also try Karmarkar-Karp partitioning (greedy is close enough beyond that)
+_KK_MAX_PRS = 4
+_KK_MAX_FILES = 1000
+
+# Runs of characters not kept in branch names generated from module names
+_BRANCH_SAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _branch_safe(name: str) -> str:
+    """Turn a module name into a branch name component ("pkg/sub dir" -> "pkg-sub-dir")."""
+    return _BRANCH_SAFE.sub("-", name).strip("-")
+
+
+def _even_batches(items: List[int], count: int) -> Iterator[List[int]]:
+    """
+    Split items into at most count consecutive batches whose sizes differ by
+    at most one (the first len(items) % count batches get the extra item).
+    """
+    size, extra = divmod(len(items), count)
+    start = 0
+    for i in range(min(count, len(items))):
+        end = start + size + (i < extra)
+        yield items[start:end]
+        start = end
+
+
+def _karmarkar_karp(sizes: List[int], count: int) -> List[Tuple[int, List[int]]]:
+    """
+    Partition sizes into count subsets with Karmarkar-Karp differencing.
+    
+    Every size starts as its own partition; the two partitions with the
+    largest spread are merged until one is left, pairing the largest subset
+    of one with the smallest subset of the other.
+    
+    Returns:
+        (total, positions in sizes) of each subset, largest total first
+    """
+    order = itertools.count()
+    heap = [
+        (-size, next(order), [(size, [pos])] + [(0, []) for _ in range(count - 1)])
+        for pos, size in enumerate(sizes)
+    ]
+    if not heap:
+        return [(0, []) for _ in range(count)]
+    heapq.heapify(heap)
+    
+    while len(heap) > 1:
+        _, _, first = heapq.heappop(heap)
+        _, _, second = heapq.heappop(heap)
+        merged = []
+        for (total_a, subset_a), (total_b, subset_b) in zip(first, reversed(second)):
+            # Extend the longer subset so each position is copied O(log n) times
+            if len(subset_a) < len(subset_b):
+                subset_a, subset_b = subset_b, subset_a
+            subset_a.extend(subset_b)
+            merged.append((total_a + total_b, subset_a))
+        merged.sort(key=itemgetter(0), reverse=True)
+        heapq.heappush(heap, (merged[-1][0] - merged[0][0], next(order), merged))
+    
+    return heap[0][2]
+
+
+def _group_indices(keys: List[str]) -> Dict[str, List[int]]:
+    """Indices of each distinct key, keys in first-seen order."""
+    if keys and keys.count(keys[0]) == len(keys):
+        # One key (e.g. a tree with only root files): list.count scans in C,
+        # skipping the Python-level grouping loop
+        return {keys[0]: list(range(len(keys)))}
+    
+    groups = defaultdict(list)
+    for i, key in enumerate(keys):
+        groups[key].append(i)
+    return dict(groups)
+
+
+@dataclass(frozen=True, slots=True)
+class _FileColumns:
+    """
+    The fields of analyzed files the splitters use, as parallel lists.
+    
+    Splitters group and sort file indices, then gather paths and line
+    totals per PR with map over the columns, which runs in C. One frozen
+    snapshot is shared by every plan of a tree, so splitters must only
+    read the columns (they stay lists: list.__getitem__ is a cheaper
+    map callable than tuple's).
+    """
+    paths: List[str]
+    lines: List[int]
+    modules: List[str]
+    extensions: List[str]
+    # File indices of each module, grouped once per snapshot
+    module_indices: Dict[str, List[int]]
+    
+    @classmethod
+    def from_files(cls, files: List[Dict[str, Any]]) -> "_FileColumns":
+        """Extract the columns from analyzed file dicts."""
+        try:
+            paths, lines, modules, extensions = (
+                list(map(itemgetter(key), files))
+                for key in ("path", "lines", "module", "extension")
+            )
+        except KeyError:
+            # Not full FileInfo dicts: default the optional fields
+            paths = [f["path"] for f in files]
+            lines = [f.get("lines", 0) for f in files]
+            modules = [f.get("module", "root") for f in files]
+            extensions = [f.get("extension", "") for f in files]
+        return cls(paths, lines, modules, extensions, _group_indices(modules))
+    
+    def paths_and_lines(self, indices: List[int]) -> Tuple[List[str], int]:
+        """Paths and total lines of the files at indices."""
+        return list(map(self.paths.__getitem__, indices)), sum(map(self.lines.__getitem__, indices))
+
 
 class SplitStrategy(Enum):
     """Strategy for splitting code."""
@@ -25,7 +145,14 @@ class SplitStrategy(Enum):
     BALANCED = "balanced"        # Balance files across PRs by size
 
 
-@dataclass
+# Strategy for each accepted strategy argument, a value or a member
+_STRATEGIES = {
+    **{strategy.value: strategy for strategy in SplitStrategy},
+    **{strategy: strategy for strategy in SplitStrategy},
+}
+
+
+@dataclass(slots=True)
 class PRDefinition:
     """Definition of a single PR in the split plan."""
     index: int
@@ -49,7 +176,7 @@ class PRDefinition:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitPlan:
     """Complete split plan for a codebase."""
     source_path: str
@@ -60,6 +187,8 @@ class SplitPlan:
     prs: List[PRDefinition] = field(default_factory=list)
     total_files: int = 0
     total_lines: int = 0
+    # Stamped once, so repeated to_dict calls serialize the same plan
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,7 +197,7 @@ class SplitPlan:
             "strategy": self.strategy.value,
             "base_branch": self.base_branch,
             "branch_prefix": self.branch_prefix,
-            "prs": [pr.to_dict() for pr in self.prs],
+            "prs": list(map(PRDefinition.to_dict, self.prs)),
             "summary": {
                 "actual_pr_count": len(self.prs),
                 "total_files": self.total_files,
@@ -76,15 +205,39 @@ class SplitPlan:
                 "avg_files_per_pr": self.total_files / len(self.prs) if self.prs else 0,
                 "avg_lines_per_pr": self.total_lines / len(self.prs) if self.prs else 0
             },
-            "created_at": datetime.now().isoformat()
+            "created_at": self.created_at
         }
 
 
 class SplitPlanner:
     """Generates split plans for code."""
     
-    def __init__(self):
-        self.analyzer = CodeAnalyzer()
+    # Split method per strategy; others (by_dependency) split by module
+    _STRATEGY_DISPATCH = {
+        SplitStrategy.BY_MODULE: "_split_by_module",
+        SplitStrategy.BY_FILE: "_split_by_file",
+        SplitStrategy.BY_TYPE: "_split_by_type",
+        SplitStrategy.BALANCED: "_split_balanced",
+    }
+    
+    def __init__(self, analyzer: Optional[CodeAnalyzer] = None):
+        """
+        Args:
+            analyzer: Analyzer to use, so its cached analyses can be shared
+                with other callers (a new one is created by default)
+        """
+        self.analyzer = analyzer or CodeAnalyzer()
+        
+        # Source path -> (analysis files list, its columns), least recently
+        # used first: the analyzer returns the same list while the tree is
+        # unchanged, so repeated plans for a source extract it once
+        self._columns_cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def clear_cache(self):
+        """Drop the cached file columns of every source."""
+        with self._lock:
+            self._columns_cache.clear()
     
     def generate_plan(
         self,
@@ -106,18 +259,19 @@ class SplitPlanner:
             
         Returns:
             Split plan with PR definitions
+            
+        The analysis comes from the analyzer's cache while no file under
+        source_path changed, so retrying with another strategy or PR count
+        only re-plans.
         """
-        # First, analyze the code structure
-        analysis = self.analyzer.analyze(source_path)
+        # First, analyze the code structure (memoized by the analyzer)
+        analysis, files = self._analyze_once(source_path)
         
-        if analysis.get("status") == "error":
+        if files is None:
             return analysis
         
-        # Parse strategy
-        try:
-            split_strategy = SplitStrategy(strategy)
-        except ValueError:
-            split_strategy = SplitStrategy.BY_MODULE
+        # Parse strategy (unknown strategies split by module)
+        split_strategy = _STRATEGIES.get(strategy, SplitStrategy.BY_MODULE)
         
         # Create split plan based on strategy
         plan = SplitPlan(
@@ -130,183 +284,197 @@ class SplitPlanner:
             total_lines=analysis["summary"]["total_lines"]
         )
         
-        # Generate PRs based on strategy
-        if split_strategy == SplitStrategy.BY_MODULE:
-            self._split_by_module(plan, analysis)
-        elif split_strategy == SplitStrategy.BY_FILE:
-            self._split_by_file(plan, analysis)
-        elif split_strategy == SplitStrategy.BY_TYPE:
-            self._split_by_type(plan, analysis)
-        elif split_strategy == SplitStrategy.BALANCED:
-            self._split_balanced(plan, analysis)
+        # Generate PRs based on strategy (every strategy reduces to one PR
+        # when at most one is asked for)
+        if target_pr_count <= 1:
+            self._split_single(plan, files)
         else:
-            self._split_by_module(plan, analysis)
+            split = getattr(self, self._STRATEGY_DISPATCH.get(split_strategy, "_split_by_module"))
+            split(plan, files)
         
         return {
             "status": "success",
             "plan": plan.to_dict()
         }
     
-    def _split_by_module(self, plan: SplitPlan, analysis: Dict[str, Any]):
-        """Split by top-level modules/directories."""
-        modules = analysis.get("modules", {})
-        files_by_module = {}
+    def _analyze_once(self, source_path: str) -> Tuple[Dict[str, Any], Optional[_FileColumns]]:
+        """
+        Analyze source_path and snapshot its files as columns.
         
-        # Group files by module
-        for file_info in analysis.get("files", []):
-            module = file_info.get("module", "root")
-            if module not in files_by_module:
-                files_by_module[module] = []
-            files_by_module[module].append(file_info)
+        Args:
+            source_path: Path to source directory
+            
+        Returns:
+            The analysis and its file columns (None if the analysis failed).
+            The columns are reused while the analyzer returns the same,
+            unchanged file list for source_path.
+        """
+        analysis = self.analyzer.analyze(source_path)
+        if analysis.get("status") == "error":
+            return analysis, None
+        
+        analyzed_files = analysis.get("files", [])
+        with self._lock:
+            cached = self._columns_cache.get(source_path)
+            if cached is not None and cached[0] is analyzed_files:
+                self._columns_cache.move_to_end(source_path)
+                return analysis, cached[1]
+        
+        columns = _FileColumns.from_files(analyzed_files)
+        with self._lock:
+            # Bounded like the analyzer's cache, whose file lists these pin
+            self._columns_cache[source_path] = (analyzed_files, columns)
+            self._columns_cache.move_to_end(source_path)
+            if len(self._columns_cache) > ANALYSIS_CACHE_SIZE:
+                self._columns_cache.popitem(last=False)
+        return analysis, columns
+    
+    def _split_single(self, plan: SplitPlan, files: _FileColumns):
+        """Put all files in one PR, in path order."""
+        if not files.paths:
+            return
         
-        # Sort modules by file count (larger modules first)
-        sorted_modules = sorted(
-            files_by_module.keys(),
-            key=lambda m: len(files_by_module[m]),
-            reverse=True
+        paths = sorted(files.paths)
+        lines = sum(files.lines)
+        pr = PRDefinition(
+            index=0,
+            name=f"Add all files (~{lines} lines)",
+            branch_name=f"{plan.branch_prefix}-all",
+            files=paths,
+            description=f"Add {len(paths)} files",
+            estimated_lines=lines
         )
+        plan.prs.append(pr)
+    
+    def _split_by_module(self, plan: SplitPlan, files: _FileColumns):
+        """Split by top-level modules/directories."""
+        files_by_module = files.module_indices
+        
+        # Sort modules by file count (larger modules first, stable on ties)
+        sorted_modules = sorted(files_by_module, key=lambda m, d=files_by_module: -len(d[m]))
         
         # If we have fewer modules than target PRs, split large modules
         if len(sorted_modules) < plan.target_pr_count:
             # Just create one PR per module
             for idx, module in enumerate(sorted_modules):
-                files = files_by_module[module]
+                paths, lines = files.paths_and_lines(files_by_module[module])
                 pr = PRDefinition(
                     index=idx,
                     name=f"Add {module} module" if module != "root" else "Add root files",
-                    branch_name=f"{plan.branch_prefix}-{module.replace('/', '-')}",
-                    files=[f["path"] for f in files],
-                    description=f"Add {module} module with {len(files)} files",
-                    estimated_lines=sum(f.get("lines", 0) for f in files)
+                    branch_name=f"{plan.branch_prefix}-{_branch_safe(module)}",
+                    files=paths,
+                    description=f"Add {module} module with {len(paths)} files",
+                    estimated_lines=lines
                 )
                 plan.prs.append(pr)
         else:
             # Combine small modules to reach target count
-            self._combine_modules_to_target(plan, files_by_module, sorted_modules)
+            self._combine_modules_to_target(plan, files, files_by_module, sorted_modules)
     
     def _combine_modules_to_target(
         self,
         plan: SplitPlan,
-        files_by_module: Dict[str, List[Dict]],
+        files: _FileColumns,
+        files_by_module: Dict[str, List[int]],
         sorted_modules: List[str]
     ):
-        """Combine modules to reach target PR count."""
+        """
+        Combine modules into exactly target PRs, keeping each module whole.
+        
+        Modules are assigned largest first (by lines) to the PR with the
+        fewest lines so far (longest-processing-time scheduling), which keeps
+        PR sizes within about one module of each other.
+        """
         target = plan.target_pr_count
         
-        # Simple distribution: divide modules evenly
-        modules_per_pr = max(1, len(sorted_modules) // target)
+        module_files = {}
+        module_lines = {}
+        for module in sorted_modules:
+            module_files[module], module_lines[module] = files.paths_and_lines(files_by_module[module])
+        
+        # Heap of (lines, modules, PR index): empty PRs are filled first, ties go to the lowest index
+        bins: List[List[str]] = [[] for _ in range(target)]
+        heap = [(0, 0, i) for i in range(target)]
+        for module in sorted(sorted_modules, key=module_lines.__getitem__, reverse=True):
+            lines, count, i = heap[0]
+            bins[i].append(module)
+            heapq.heapreplace(heap, (lines + module_lines[module], count + 1, i))
         
         idx = 0
-        for i in range(0, len(sorted_modules), modules_per_pr):
-            batch_modules = sorted_modules[i:i + modules_per_pr]
-            
-            # Collect all files from these modules
-            all_files = []
-            for module in batch_modules:
-                all_files.extend(files_by_module[module])
-            
-            if not all_files:
+        for batch_modules in bins:
+            if not batch_modules:
                 continue
             
-            # Create PR definition
+            # Create PR definition (the module list is joined once for name and description)
+            module_list = ", ".join(batch_modules)
             if len(batch_modules) == 1:
                 name = f"Add {batch_modules[0]} module"
-                suffix = batch_modules[0].replace('/', '-')
+                suffix = _branch_safe(batch_modules[0])
             else:
-                name = f"Add modules: {', '.join(batch_modules[:3])}"
                 if len(batch_modules) > 3:
-                    name += f" (+{len(batch_modules) - 3} more)"
+                    name = f"Add modules: {', '.join(batch_modules[:3])} (+{len(batch_modules) - 3} more)"
+                else:
+                    name = f"Add modules: {module_list}"
                 suffix = f"batch-{idx}"
             
+            paths = []
+            for module in batch_modules:
+                paths.extend(module_files[module])
+            
             pr = PRDefinition(
                 index=idx,
                 name=name,
                 branch_name=f"{plan.branch_prefix}-{suffix}",
-                files=[f["path"] for f in all_files],
-                description=f"Add {len(batch_modules)} module(s): {', '.join(batch_modules)}",
-                estimated_lines=sum(f.get("lines", 0) for f in all_files)
+                files=paths,
+                description=f"Add {len(batch_modules)} module(s): {module_list}",
+                estimated_lines=sum(module_lines[module] for module in batch_modules)
             )
             plan.prs.append(pr)
             idx += 1
-            
-            if idx >= target:
-                # Add remaining to last PR
-                if i + modules_per_pr < len(sorted_modules):
-                    remaining_modules = sorted_modules[i + modules_per_pr:]
-                    for module in remaining_modules:
-                        pr.files.extend(f["path"] for f in files_by_module[module])
-                    pr.description += f" (+ {len(remaining_modules)} more modules)"
-                break
     
-    def _split_by_file(self, plan: SplitPlan, analysis: Dict[str, Any]):
+    def _split_by_file(self, plan: SplitPlan, files: _FileColumns):
         """Split by individual files, distributing evenly."""
-        files = analysis.get("files", [])
         target = plan.target_pr_count
         
         # Sort files by path for consistent ordering
-        sorted_files = sorted(files, key=lambda f: f["path"])
+        sorted_files = sorted(range(len(files.paths)), key=files.paths.__getitem__)
         
         # Distribute files evenly
-        files_per_pr = max(1, len(sorted_files) // target)
-        
-        for idx in range(target):
-            start = idx * files_per_pr
-            if idx == target - 1:
-                # Last PR gets all remaining files
-                batch_files = sorted_files[start:]
-            else:
-                batch_files = sorted_files[start:start + files_per_pr]
-            
-            if not batch_files:
-                break
-            
+        for idx, batch_files in enumerate(_even_batches(sorted_files, target)):
+            paths, lines = files.paths_and_lines(batch_files)
             pr = PRDefinition(
                 index=idx,
                 name=f"Add files batch {idx + 1}",
                 branch_name=f"{plan.branch_prefix}-batch-{idx + 1}",
-                files=[f["path"] for f in batch_files],
+                files=paths,
                 description=f"Add {len(batch_files)} files",
-                estimated_lines=sum(f.get("lines", 0) for f in batch_files)
+                estimated_lines=lines
             )
             plan.prs.append(pr)
     
-    def _split_by_type(self, plan: SplitPlan, analysis: Dict[str, Any]):
+    def _split_by_type(self, plan: SplitPlan, files: _FileColumns):
         """Split by file type (configs first, then code, then docs)."""
-        files = analysis.get("files", [])
-        
-        # Categorize files
-        configs = []
-        code_files = []
-        docs = []
-        others = []
         
-        code_exts = set(CodeAnalyzer.CODE_EXTENSIONS.keys())
-        config_exts = CodeAnalyzer.CONFIG_EXTENSIONS
-        doc_exts = CodeAnalyzer.DOC_EXTENSIONS
-        
-        for f in files:
-            ext = f.get("extension", "")
-            if ext in config_exts:
-                configs.append(f)
-            elif ext in code_exts:
-                code_files.append(f)
-            elif ext in doc_exts:
-                docs.append(f)
-            else:
-                others.append(f)
+        # Categorize file indices with one lookup in the analyzer's extension map
+        buckets = {"config": [], "code": [], "docs": [], "other": []}
+        category = CodeAnalyzer.EXTENSION_CATEGORIES.get
+        for i, ext in enumerate(files.extensions):
+            buckets[category(ext, "other")].append(i)
+        configs, code_files, docs, others = buckets.values()
         
         # Create PRs for each category
         idx = 0
         
         # 1. Configs and setup (PR 0)
         if configs or others:
+            paths, lines = files.paths_and_lines(configs + others)
             pr = PRDefinition(
                 index=idx,
                 name="Add project configuration",
                 branch_name=f"{plan.branch_prefix}-configs",
-                files=[f["path"] for f in configs + others],
+                files=paths,
                 description=f"Add configuration files ({len(configs)} config, {len(others)} other)",
-                estimated_lines=sum(f.get("lines", 0) for f in configs + others)
+                estimated_lines=lines
             )
             plan.prs.append(pr)
             idx += 1
@@ -314,25 +482,15 @@ class SplitPlanner:
         # 2. Code files (split into multiple PRs if needed)
         remaining_prs = plan.target_pr_count - idx - (1 if docs else 0)
         if code_files and remaining_prs > 0:
-            files_per_pr = max(1, len(code_files) // remaining_prs)
-            
-            for i in range(remaining_prs):
-                start = i * files_per_pr
-                if i == remaining_prs - 1:
-                    batch = code_files[start:]
-                else:
-                    batch = code_files[start:start + files_per_pr]
-                
-                if not batch:
-                    break
-                
+            for i, batch in enumerate(_even_batches(code_files, remaining_prs)):
+                paths, lines = files.paths_and_lines(batch)
                 pr = PRDefinition(
                     index=idx,
                     name=f"Add source code batch {i + 1}",
                     branch_name=f"{plan.branch_prefix}-code-{i + 1}",
-                    files=[f["path"] for f in batch],
+                    files=paths,
                     description=f"Add {len(batch)} source files",
-                    estimated_lines=sum(f.get("lines", 0) for f in batch),
+                    estimated_lines=lines,
                     depends_on=[0] if configs else []
                 )
                 plan.prs.append(pr)
@@ -340,33 +498,49 @@ class SplitPlanner:
         
         # 3. Documentation (last PR)
         if docs:
+            paths, lines = files.paths_and_lines(docs)
             pr = PRDefinition(
                 index=idx,
                 name="Add documentation",
                 branch_name=f"{plan.branch_prefix}-docs",
-                files=[f["path"] for f in docs],
+                files=paths,
                 description=f"Add {len(docs)} documentation files",
-                estimated_lines=sum(f.get("lines", 0) for f in docs)
+                estimated_lines=lines
             )
             plan.prs.append(pr)
     
-    def _split_balanced(self, plan: SplitPlan, analysis: Dict[str, Any]):
+    def _split_balanced(self, plan: SplitPlan, files: _FileColumns):
         """Split to balance lines of code across PRs."""
-        files = analysis.get("files", [])
         target = plan.target_pr_count
+        file_lines = files.lines
         
         # Sort files by lines (descending) for better distribution
-        sorted_files = sorted(files, key=lambda f: f.get("lines", 0), reverse=True)
+        sorted_files = sorted(range(len(file_lines)), key=file_lines.__getitem__, reverse=True)
         
-        # Use greedy algorithm to balance
-        pr_files: List[List[Dict]] = [[] for _ in range(target)]
+        # Use greedy algorithm to balance, with a heap of (lines, PR index)
+        pr_files: List[List[int]] = [[] for _ in range(target)]
         pr_lines: List[int] = [0] * target
+        heap = [(0, i) for i in range(target)]
         
         for f in sorted_files:
-            # Add to the PR with fewest lines
-            min_idx = pr_lines.index(min(pr_lines))
+            # Add to the PR with fewest lines (lowest index on ties)
+            lines, min_idx = heap[0]
+            lines += file_lines[f]
             pr_files[min_idx].append(f)
-            pr_lines[min_idx] += f.get("lines", 0)
+            pr_lines[min_idx] = lines
+            heapq.heapreplace(heap, (lines, min_idx))
+        
+        # Differencing often balances a few PRs better; keep it if it does
+        if 1 < target <= _KK_MAX_PRS and 0 < len(sorted_files) <= _KK_MAX_FILES:
+            partition = _karmarkar_karp(list(map(file_lines.__getitem__, sorted_files)), target)
+            if partition[0][0] - partition[-1][0] < max(pr_lines) - min(pr_lines):
+                # Empty PRs last; files largest first, as greedy orders them
+                partition.sort(key=lambda subset: (-subset[0], not subset[1]))
+                pr_lines = [lines for lines, _ in partition]
+                pr_files = [
+                    list(map(sorted_files.__getitem__, sorted(positions)))
+                    for _, positions in partition
+                ]
         
         # Create PR definitions
         for idx, (files_list, lines) in enumerate(zip(pr_files, pr_lines)):
@@ -377,7 +551,7 @@ class SplitPlanner:
                 index=idx,
                 name=f"Add files batch {idx + 1} (~{lines} lines)",
                 branch_name=f"{plan.branch_prefix}-batch-{idx + 1}",
-                files=[f["path"] for f in files_list],
+                files=list(map(files.paths.__getitem__, files_list)),
                 description=f"Add {len(files_list)} files (~{lines} lines)",
                 estimated_lines=lines
             )